@@ -1,8 +1,20 @@
 """cc-sdd MCP Server - Model Context Protocol server for Spec-Driven Development."""
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "cc-sdd contributors"
 
-from cc_sdd_mcp.server import create_server
+if TYPE_CHECKING:
+    from cc_sdd_mcp.server import create_server
 
 __all__ = ["create_server", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve heavy exports lazily so CLI fast paths skip the MCP server import."""
+    if name == "create_server":
+        from cc_sdd_mcp.server import create_server
+
+        return create_server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
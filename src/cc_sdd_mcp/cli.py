@@ -1,19 +1,52 @@
 """Command-line interface for cc-sdd MCP server."""
 
 import asyncio
-import json
+import os
 import sys
+from collections import defaultdict
+from collections.abc import Callable, Coroutine
 from pathlib import Path
 from typing import Any
 
 import click
 
-from cc_sdd_mcp.models.config import ServerConfig
-from cc_sdd_mcp.server import serve
-from cc_sdd_mcp.tools.registry import get_all_tools, get_tool_handler
-
 __version__ = "0.1.0"
 
+# Tool name prefix (text before the first underscore) -> list-tools category
+_CATEGORY_BY_PREFIX = {
+    "steering": "Steering",
+    "spec": "Specification",
+    "template": "Template",
+    "validate": "Validation",
+}
+
+
+def _run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion on a fresh event loop.
+
+    Uses uvloop's event loop when it is installed, otherwise the default
+    asyncio loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        pass
+
+    if loop_factory is None:
+        return asyncio.run(coro)
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
 
 @click.group(invoke_without_command=True)
 @click.pass_context
@@ -35,7 +68,7 @@ def cli(ctx: click.Context, config: Path | None, version: bool) -> None:
 
     # If no subcommand is provided, default to start
     if ctx.invoked_subcommand is None:
-        ctx.invoke(start, config=config, log_level=None)
+        ctx.invoke(start, config=config, log_level=None, quiet=False)
 
 
 @cli.command()
@@ -51,7 +84,13 @@ def cli(ctx: click.Context, config: Path | None, version: bool) -> None:
     type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"], case_sensitive=False),
     help="Logging level",
 )
-def start(config: Path | None, log_level: str | None) -> None:
+@click.option(
+    "--quiet",
+    "-q",
+    is_flag=True,
+    help="Suppress the startup banner (also enabled by CC_SDD_QUIET=1)",
+)
+def start(config: Path | None, log_level: str | None, quiet: bool) -> None:
     """Start the MCP server.
 
     The server communicates via stdio (standard input/output) using the
@@ -69,7 +108,20 @@ def start(config: Path | None, log_level: str | None) -> None:
         # Start with debug logging
         cc-sdd-mcp start --log-level DEBUG
     """
+    _run_server(config, log_level, quiet=quiet)
+
+
+def _run_server(config: Path | None, log_level: str | None, quiet: bool = False) -> None:
+    """Load configuration and run the MCP server until it exits.
+
+    Args:
+        config: Optional path to configuration file
+        log_level: Optional log level override
+        quiet: Suppress the startup banner
+    """
     try:
+        from cc_sdd_mcp.models.config import ServerConfig
+
         # Load configuration
         server_config = ServerConfig.load(config) if config else ServerConfig.load()
 
@@ -77,16 +129,19 @@ def start(config: Path | None, log_level: str | None) -> None:
         if log_level and isinstance(log_level, str):
             server_config.log_level = log_level.upper()
 
-        # Start the server
-        click.echo(
-            f"Starting {server_config.server_name} v{server_config.server_version}",
-            err=True,
-        )
-        click.echo(f"Project directory: {server_config.project_dir}", err=True)
-        click.echo(f"Log level: {server_config.log_level}", err=True)
+        # Print the startup banner in a single write; MCP clients may respawn
+        # the server often and can silence it with CC_SDD_QUIET
+        if not (quiet or os.environ.get("CC_SDD_QUIET")):
+            sys.stderr.write(
+                f"Starting {server_config.server_name} v{server_config.server_version}\n"
+                f"Project directory: {server_config.project_dir}\n"
+                f"Log level: {server_config.log_level}\n"
+            )
 
-        # Run the server
-        asyncio.run(serve(server_config))
+        # Run the server (imported here so other commands skip the MCP stack)
+        from cc_sdd_mcp.server import serve
+
+        _run_coroutine(serve(server_config))
 
     except KeyboardInterrupt:
         click.echo("\nServer stopped by user", err=True)
@@ -111,6 +166,10 @@ def list_tools(json_output: bool) -> None:
         # List tools in JSON format
         cc-sdd-mcp list-tools --json
     """
+    import json
+
+    from cc_sdd_mcp.tools.registry import get_all_tools
+
     tools = get_all_tools()
 
     if json_output:
@@ -127,24 +186,16 @@ def list_tools(json_output: bool) -> None:
         click.echo("=" * 60)
 
         # Group tools by category
-        categories = {
-            "Steering": [],
-            "Specification": [],
-            "Template": [],
-            "Validation": [],
-        }
+        categories: defaultdict[str, list[Any]] = defaultdict(list)
 
         for tool in tools:
-            if tool.name.startswith("steering_"):
-                categories["Steering"].append(tool)
-            elif tool.name.startswith("spec_"):
-                categories["Specification"].append(tool)
-            elif tool.name.startswith("template_"):
-                categories["Template"].append(tool)
-            elif tool.name.startswith("validate_"):
-                categories["Validation"].append(tool)
-
-        for category, cat_tools in categories.items():
+            category = _CATEGORY_BY_PREFIX.get(tool.name.partition("_")[0])
+            if category:
+                categories[category].append(tool)
+
+        # Print in declaration order, skipping categories with no tools
+        for category in _CATEGORY_BY_PREFIX.values():
+            cat_tools = categories.get(category)
             if cat_tools:
                 click.echo(f"\n📁 {category} Tools:")
                 for tool in cat_tools:
@@ -171,10 +222,14 @@ def inspect_tool(tool_name: str, json_output: bool) -> None:
         # Inspect a tool with JSON output
         cc-sdd-mcp inspect-tool spec_init --json
     """
-    tools = get_all_tools()
-    tool = next((t for t in tools if t.name == tool_name), None)
+    import json
+
+    from cc_sdd_mcp.tools.registry import get_all_tools, get_tool
+
+    tool = get_tool(tool_name)
 
     if not tool:
+        tools = get_all_tools()
         click.echo(f"❌ Tool '{tool_name}' not found", err=True)
         click.echo(f"\nAvailable tools: {', '.join(t.name for t in tools)}", err=True)
         sys.exit(1)
@@ -225,6 +280,10 @@ def test_tool(tool_name: str, args: str | None) -> None:
         # Test steering_status
         cc-sdd-mcp test-tool steering_status
     """
+    import json
+
+    from cc_sdd_mcp.tools.registry import get_all_tools, get_tool_handler
+
     handler = get_tool_handler(tool_name)
 
     if not handler:
@@ -248,13 +307,11 @@ def test_tool(tool_name: str, args: str | None) -> None:
     click.echo(f"\nArguments: {json.dumps(tool_args, indent=2)}\n")
 
     try:
+        from cc_sdd_mcp.server import format_result
 
-        async def run_test() -> Any:
-            return await handler(tool_args)
-
-        result = asyncio.run(run_test())
+        result = _run_coroutine(handler(tool_args))
         click.echo("Result:")
-        click.echo(result)
+        click.echo(format_result(result, pretty=True))
         click.echo("\n" + "=" * 60)
         click.echo("\n✅ Tool executed successfully")
 
@@ -291,6 +348,8 @@ def validate_config(config: Path | None) -> None:
     click.echo("\n🔍 Validating configuration...\n")
     click.echo("=" * 60)
 
+    from cc_sdd_mcp.models.config import ServerConfig
+
     try:
         server_config = ServerConfig.load(config) if config else ServerConfig.load()
 
@@ -323,6 +382,12 @@ def version() -> None:
 
 def main() -> None:
     """Entry point for the CLI."""
+    # MCP clients spawn the server without arguments; skip Click's parsing
+    # and context setup on that path and start serving directly.
+    if len(sys.argv) == 1:
+        _run_server(None, None)
+        return
+
     cli()
 
 
@@ -0,0 +1,55 @@
+"""Timestamp source for model default factories."""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+# Timestamp shared by every model built inside a frozen_now() block
+_NOW: ContextVar[datetime | None] = ContextVar("_NOW", default=None)
+
+# (monotonic millisecond, wall-clock timestamp) of the last now() call
+_cached: tuple[int, datetime] = (-1, datetime.min)
+
+
+def _wall_clock() -> datetime:
+    """Read the wall-clock time at most once per monotonic millisecond."""
+    global _cached
+    ms = time.monotonic_ns() // 1_000_000
+    cached_ms, cached_now = _cached
+    if ms != cached_ms:
+        cached_now = datetime.now()
+        _cached = (ms, cached_now)
+    return cached_now
+
+
+def now() -> datetime:
+    """Return the timestamp to stamp a new model with.
+
+    Inside a frozen_now() block this is the frozen timestamp. Otherwise the
+    wall clock is read at most once per millisecond, so models created in a
+    tight loop share a timestamp instead of each calling datetime.now().
+
+    Returns:
+        Current timestamp
+    """
+    return _NOW.get() or _wall_clock()
+
+
+@contextmanager
+def frozen_now(now: datetime | None = None) -> Iterator[datetime]:
+    """Stamp all models constructed in this block with a single timestamp.
+
+    Args:
+        now: Timestamp to use (defaults to the current time)
+
+    Yields:
+        The frozen timestamp
+    """
+    now = now or _wall_clock()
+    token = _NOW.set(now)
+    try:
+        yield now
+    finally:
+        _NOW.reset(token)
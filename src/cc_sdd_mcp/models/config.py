@@ -2,15 +2,37 @@
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, field_validator
+
+# Environment variables mapped to config fields
+_ENV_MAPPING: tuple[tuple[str, str], ...] = (
+    ("CC_SDD_SERVER_NAME", "server_name"),
+    ("CC_SDD_SERVER_VERSION", "server_version"),
+    ("CC_SDD_LOG_LEVEL", "log_level"),
+    ("CC_SDD_PROJECT_DIR", "project_dir"),
+    ("CC_SDD_KIRO_DIR", "kiro_dir"),
+    ("CC_SDD_DEFAULT_LANGUAGE", "default_language"),
+    ("CC_SDD_TEMPLATE_CACHE_ENABLED", "template_cache_enabled"),
+    ("CC_SDD_AUTO_CREATE_STEERING", "auto_create_steering"),
+    ("CC_SDD_STRICT_PHASE_GATES", "strict_phase_gates"),
+)
+
+# Config file picked up from the current directory
+_LOCAL_CONFIG_PATH = Path(".cc-sdd.config.json")
+
+# Config fields parsed as booleans from environment variables
+_BOOL_FIELDS = frozenset({"template_cache_enabled", "auto_create_steering", "strict_phase_gates"})
 
 
 class ServerConfig(BaseModel):
     """Configuration for the MCP server."""
 
+    model_config = ConfigDict(defer_build=True)
+
     # Server settings
     server_name: str = Field(default="cc-sdd-mcp", description="Name of the MCP server")
     server_version: str = Field(default="0.1.0", description="Server version")
@@ -19,7 +41,9 @@ class ServerConfig(BaseModel):
     )
 
     # Project settings
-    project_dir: Path = Field(default_factory=lambda: Path("."), description="Project directory")
+    project_dir: Annotated[Path, PlainSerializer(str, return_type=str)] = Field(
+        default_factory=lambda: Path("."), description="Project directory"
+    )
     kiro_dir: str = Field(default=".kiro", description="Kiro directory name")
 
     # Template settings
@@ -38,6 +62,16 @@ class ServerConfig(BaseModel):
         default=True, description="Enforce strict phase gate approval requirements"
     )
 
+    @field_validator("project_dir", mode="after")
+    @classmethod
+    def normalize_project_dir(cls, v: Path) -> Path:
+        """Collapse redundant separators and '..' lexically.
+
+        The path is deliberately not resolved against the filesystem; call
+        ``project_dir.resolve()`` where an absolute path is actually needed.
+        """
+        return Path(os.path.normpath(v))
+
     @classmethod
     def from_file(cls, config_path: Path | str) -> "ServerConfig":
         """Load configuration from a JSON file.
@@ -58,8 +92,8 @@ class ServerConfig(BaseModel):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
         try:
-            config_data = json.loads(config_path.read_text())
-            return cls(**config_data)
+            config_data = json.loads(config_path.read_bytes())
+            return cls.model_validate(config_data)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file: {e}") from e
         except Exception as e:
@@ -75,30 +109,16 @@ class ServerConfig(BaseModel):
         Returns:
             ServerConfig instance with values from environment
         """
-        env_config: dict[str, Any] = {}
+        env = os.environ
+        if not any(env_var in env for env_var, _ in _ENV_MAPPING):
+            return cls()
 
-        # Map environment variables to config fields
-        env_mapping = {
-            "CC_SDD_SERVER_NAME": "server_name",
-            "CC_SDD_SERVER_VERSION": "server_version",
-            "CC_SDD_LOG_LEVEL": "log_level",
-            "CC_SDD_PROJECT_DIR": "project_dir",
-            "CC_SDD_KIRO_DIR": "kiro_dir",
-            "CC_SDD_DEFAULT_LANGUAGE": "default_language",
-            "CC_SDD_TEMPLATE_CACHE_ENABLED": "template_cache_enabled",
-            "CC_SDD_AUTO_CREATE_STEERING": "auto_create_steering",
-            "CC_SDD_STRICT_PHASE_GATES": "strict_phase_gates",
-        }
-
-        for env_var, field_name in env_mapping.items():
-            value = os.getenv(env_var)
+        env_config: dict[str, Any] = {}
+        for env_var, field_name in _ENV_MAPPING:
+            value = env.get(env_var)
             if value is not None:
                 # Handle boolean conversion
-                if field_name in [
-                    "template_cache_enabled",
-                    "auto_create_steering",
-                    "strict_phase_gates",
-                ]:
+                if field_name in _BOOL_FIELDS:
                     env_config[field_name] = value.lower() in ("true", "1", "yes")
                 # Handle Path conversion
                 elif field_name == "project_dir":
@@ -106,7 +126,7 @@ class ServerConfig(BaseModel):
                 else:
                     env_config[field_name] = value
 
-        return cls(**env_config)
+        return cls.model_validate(env_config)
 
     @classmethod
     def load(cls, config_path: Path | str | None = None) -> "ServerConfig":
@@ -128,7 +148,7 @@ class ServerConfig(BaseModel):
         # Try provided path
         if config_path:
             try:
-                return cls.from_file(config_path)
+                return cls._from_file_cached(config_path)
             except FileNotFoundError:
                 pass  # Fall through to next option
 
@@ -136,40 +156,64 @@ class ServerConfig(BaseModel):
         env_config_path = os.getenv("CC_SDD_CONFIG_PATH")
         if env_config_path:
             try:
-                return cls.from_file(env_config_path)
+                return cls._from_file_cached(env_config_path)
             except FileNotFoundError:
                 pass
 
-        # Try local config file
-        local_config = Path(".cc-sdd.config.json")
-        if local_config.exists():
-            try:
-                return cls.from_file(local_config)
-            except (FileNotFoundError, ValueError):
-                pass
+        # Try local config file (the cached loader's stat doubles as the existence probe)
+        try:
+            return cls._from_file_cached(_LOCAL_CONFIG_PATH)
+        except (FileNotFoundError, ValueError):
+            pass
 
         # Try environment variables
         try:
-            return cls.from_env()
+            env_snapshot = tuple(os.environ.get(env_var) for env_var, _ in _ENV_MAPPING)
+            return _config_from_env(cls, env_snapshot).model_copy()
         except Exception:
             pass
 
         # Return defaults
         return cls()
 
-    def save(self, config_path: Path | str) -> None:
-        """Save configuration to a JSON file.
+    @classmethod
+    def _from_file_cached(cls, config_path: Path | str) -> "ServerConfig":
+        """Load configuration from a JSON file, reusing earlier parses.
+
+        Parsed configs are cached per (path, mtime, size), so an edited file is
+        picked up on the next call. Callers receive a copy they may mutate.
 
         Args:
-            config_path: Path where to save the configuration
+            config_path: Path to configuration file
+
+        Returns:
+            ServerConfig instance
+
+        Raises:
+            FileNotFoundError: If config file doesn't exist
+            ValueError: If config file is invalid
         """
         config_path = Path(config_path)
 
-        # Convert to dict and handle Path serialization
-        config_dict = self.model_dump()
-        config_dict["project_dir"] = str(config_dict["project_dir"])
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
 
-        config_path.write_text(json.dumps(config_dict, indent=2))
+        cached = _parse_config_file(cls, str(config_path), stat.st_mtime_ns, stat.st_size)
+        return cached.model_copy()
+
+    def save(self, config_path: Path | str, *, pretty: bool = True) -> None:
+        """Save configuration to a JSON file.
+
+        Args:
+            config_path: Path where to save the configuration
+            pretty: Indent the output for human editing; pass False for
+                compact JSON when the file is only read back by machines
+        """
+        config_path = Path(config_path)
+        config_path.write_bytes(self.model_dump_json(indent=2 if pretty else None).encode())
+        _parse_config_file.cache_clear()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert configuration to dictionary.
@@ -177,6 +221,18 @@ class ServerConfig(BaseModel):
         Returns:
             Configuration as dictionary
         """
-        config_dict = self.model_dump()
-        config_dict["project_dir"] = str(config_dict["project_dir"])
-        return config_dict
+        return self.model_dump(mode="json")
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(
+    cls: type[ServerConfig], config_path: str, mtime_ns: int, size: int
+) -> ServerConfig:
+    """Parse a config file once per (path, mtime, size) fingerprint."""
+    return cls.from_file(config_path)
+
+
+@lru_cache(maxsize=8)
+def _config_from_env(cls: type[ServerConfig], env_snapshot: tuple[str | None, ...]) -> ServerConfig:
+    """Build an environment-derived config once per distinct CC_SDD_* environment."""
+    return cls.from_env()
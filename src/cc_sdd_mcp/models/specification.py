@@ -1,10 +1,18 @@
 """Data models for feature specifications."""
 
+import string
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import Any, Final
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from cc_sdd_mcp.models.clock import now
+
+# Lowercases ASCII letters and maps spaces to hyphens in a single pass
+_NAME_TABLE = str.maketrans(string.ascii_uppercase + " ", string.ascii_lowercase + "-")
 
 
 class SpecPhase(str, Enum):
@@ -18,16 +26,33 @@ class SpecPhase(str, Enum):
     COMPLETED = "completed"
 
 
+# Plain-string phase values for internal comparisons. SpecPhase is a str enum,
+# so members compare equal to these without going through enum attribute lookup.
+PHASE_INITIALIZED: Final = "initialized"
+PHASE_REQUIREMENTS: Final = "requirements"
+PHASE_DESIGN: Final = "design"
+PHASE_TASKS: Final = "tasks"
+PHASE_IMPLEMENTATION: Final = "implementation"
+PHASE_COMPLETED: Final = "completed"
+
+
 class SpecificationMetadata(BaseModel):
-    """Metadata for a feature specification."""
+    """Metadata for a feature specification.
+
+    Example:
+        SpecificationMetadata(feature_name="user-authentication",
+                              description="Add OAuth authentication to the system")
+    """
+
+    model_config = ConfigDict(defer_build=True)
 
     feature_name: str = Field(..., description="Name/identifier of the feature")
     description: str = Field(..., description="Brief description of the feature")
     current_phase: SpecPhase = Field(
         default=SpecPhase.INITIALIZED, description="Current phase in the workflow"
     )
-    created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
-    updated_at: datetime = Field(default_factory=datetime.now, description="Last update timestamp")
+    created_at: datetime = Field(default_factory=now, description="Creation timestamp")
+    updated_at: datetime = Field(default_factory=now, description="Last update timestamp")
     approved_phases: list[SpecPhase] = Field(
         default_factory=list, description="Phases that have been approved"
     )
@@ -39,25 +64,33 @@ class SpecificationMetadata(BaseModel):
         if not v or not v.strip():
             raise ValueError("Feature name cannot be empty")
         # Replace spaces with hyphens, convert to lowercase
-        return v.strip().lower().replace(" ", "-")
+        name = v.strip()
+        if name.isascii():
+            return name.translate(_NAME_TABLE)
+        return name.lower().replace(" ", "-")
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the metadata as indented UTF-8 JSON for metadata files.
 
-    class Config:
-        """Pydantic configuration."""
+        pydantic-core produces the bytes directly, skipping the str round-trip
+        of ``model_dump_json().encode()``.
 
-        json_schema_extra = {
-            "example": {
-                "feature_name": "user-authentication",
-                "description": "Add OAuth authentication to the system",
-                "current_phase": "requirements",
-                "created_at": "2025-01-01T12:00:00",
-                "updated_at": "2025-01-01T12:30:00",
-                "approved_phases": ["initialized"],
-            }
-        }
+        Returns:
+            Encoded metadata JSON
+        """
+        return self.__pydantic_serializer__.to_json(self, indent=2)
 
 
 class RequirementsDocument(BaseModel):
-    """Schema for requirements.md document."""
+    """Schema for requirements.md document.
+
+    Example:
+        RequirementsDocument(feature_name="user-authentication",
+                             functional_requirements=["Support Google and GitHub OAuth"],
+                             acceptance_criteria=["User can authenticate with Google"])
+    """
+
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid")
 
     feature_name: str = Field(..., description="Feature identifier")
     functional_requirements: list[str] = Field(
@@ -72,37 +105,19 @@ class RequirementsDocument(BaseModel):
     acceptance_criteria: list[str] = Field(
         default_factory=list, description="Acceptance criteria for the feature"
     )
-    created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "feature_name": "user-authentication",
-                "functional_requirements": [
-                    "Users must be able to log in with OAuth providers",
-                    "Support Google and GitHub OAuth",
-                ],
-                "non_functional_requirements": [
-                    "Authentication must complete within 2 seconds",
-                    "Must support 10,000 concurrent users",
-                ],
-                "constraints": [
-                    "Must integrate with existing user database",
-                    "Cannot modify existing API endpoints",
-                ],
-                "acceptance_criteria": [
-                    "User can successfully authenticate with Google",
-                    "User session persists across page reloads",
-                ],
-                "created_at": "2025-01-01T12:00:00",
-            }
-        }
+    created_at: datetime = Field(default_factory=now, description="Creation timestamp")
 
 
 class DesignDocument(BaseModel):
-    """Schema for design.md document."""
+    """Schema for design.md document.
+
+    Example:
+        DesignDocument(feature_name="user-authentication",
+                       architecture_overview="OAuth 2.0 flow with JWT tokens",
+                       components=[{"name": "AuthController", "description": "Handles OAuth flow"}])
+    """
+
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid")
 
     feature_name: str = Field(..., description="Feature identifier")
     architecture_overview: str = Field(..., description="High-level architecture description")
@@ -119,96 +134,75 @@ class DesignDocument(BaseModel):
     security_considerations: list[str] = Field(
         default_factory=list, description="Security considerations"
     )
-    created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "feature_name": "user-authentication",
-                "architecture_overview": "OAuth 2.0 flow with JWT tokens",
-                "components": [
-                    {"name": "AuthController", "description": "Handles OAuth flow"},
-                    {"name": "TokenService", "description": "Manages JWT tokens"},
-                ],
-                "data_models": [
-                    {"name": "User", "description": "User account model"},
-                    {"name": "OAuthToken", "description": "OAuth token storage"},
-                ],
-                "api_endpoints": [
-                    {"path": "/auth/oauth/google", "method": "GET"},
-                    {"path": "/auth/callback", "method": "POST"},
-                ],
-                "dependencies": ["passport-js", "jsonwebtoken"],
-                "security_considerations": [
-                    "Store OAuth secrets securely",
-                    "Validate redirect URIs",
-                ],
-                "created_at": "2025-01-01T12:00:00",
-            }
-        }
-
-
-class TaskItem(BaseModel):
-    """Individual task in a task breakdown."""
-
-    task_id: str = Field(..., description="Task identifier (e.g., 1.1, 2.3)")
-    title: str = Field(..., description="Task title")
-    description: str = Field(..., description="Detailed task description")
-    estimated_hours: float | None = Field(None, description="Estimated hours to complete")
-    dependencies: list[str] = Field(
-        default_factory=list, description="Task IDs this task depends on"
-    )
-    completed: bool = Field(default=False, description="Whether task is completed")
+    created_at: datetime = Field(default_factory=now, description="Creation timestamp")
+
 
-    class Config:
-        """Pydantic configuration."""
+@dataclass(slots=True)
+class TaskItem:
+    """Individual task in a task breakdown.
 
-        json_schema_extra = {
-            "example": {
-                "task_id": "1.1",
-                "title": "Set up OAuth configuration",
-                "description": "Configure OAuth client IDs and secrets",
-                "estimated_hours": 2.0,
-                "dependencies": [],
-                "completed": False,
-            }
-        }
+    A plain slotted dataclass rather than a Pydantic model: task items are
+    created in bulk when building a TasksDocument and carry no validation.
+
+    Example:
+        TaskItem(task_id="1.1", title="Set up OAuth configuration",
+                 description="Configure OAuth client IDs and secrets", estimated_hours=2.0)
+    """
+
+    task_id: str  # Task identifier (e.g., 1.1, 2.3)
+    title: str
+    description: str
+    estimated_hours: float | None = None
+    dependencies: list[str] = field(default_factory=list)  # Task IDs this task depends on
+    completed: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TaskItem":
+        """Create a task item from a plain dictionary.
+
+        Args:
+            data: Dictionary with TaskItem fields
+
+        Returns:
+            TaskItem instance
+        """
+        return cls(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the task item to a dictionary.
+
+        Returns:
+            Task item as dictionary
+        """
+        return asdict(self)
 
 
 class TasksDocument(BaseModel):
-    """Schema for tasks.md document."""
+    """Schema for tasks.md document.
+
+    Example:
+        TasksDocument(feature_name="user-authentication",
+                      tasks=[TaskItem(task_id="1.1", title="Set up OAuth configuration",
+                                      description="Configure OAuth client IDs")],
+                      total_estimated_hours=16.0)
+    """
+
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid")
 
     feature_name: str = Field(..., description="Feature identifier")
     tasks: list[TaskItem] = Field(default_factory=list, description="List of tasks")
     total_estimated_hours: float | None = Field(None, description="Total estimated hours")
-    created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "feature_name": "user-authentication",
-                "tasks": [
-                    {
-                        "task_id": "1.1",
-                        "title": "Set up OAuth configuration",
-                        "description": "Configure OAuth client IDs",
-                        "estimated_hours": 2.0,
-                        "dependencies": [],
-                        "completed": False,
-                    }
-                ],
-                "total_estimated_hours": 16.0,
-                "created_at": "2025-01-01T12:00:00",
-            }
-        }
+    created_at: datetime = Field(default_factory=now, description="Creation timestamp")
 
 
 class SpecificationStatus(BaseModel):
-    """Complete status of a specification."""
+    """Complete status of a specification.
+
+    ``files_present`` maps spec file names (requirements.md, design.md, ...)
+    to whether they exist.
+    """
+
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid")
 
     feature_name: str = Field(..., description="Feature identifier")
     spec_dir: Path = Field(..., description="Path to spec directory")
@@ -218,29 +212,3 @@ class SpecificationStatus(BaseModel):
     )
     can_proceed_to_next_phase: bool = Field(..., description="Whether can move to next phase")
     next_recommended_action: str | None = Field(None, description="Recommended next action")
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "feature_name": "user-authentication",
-                "spec_dir": ".kiro/specs/user-authentication",
-                "metadata": {
-                    "feature_name": "user-authentication",
-                    "description": "Add OAuth authentication",
-                    "current_phase": "requirements",
-                    "created_at": "2025-01-01T12:00:00",
-                    "updated_at": "2025-01-01T12:30:00",
-                    "approved_phases": ["initialized"],
-                },
-                "files_present": {
-                    "spec.json": True,
-                    "requirements.md": True,
-                    "design.md": False,
-                    "tasks.md": False,
-                },
-                "can_proceed_to_next_phase": True,
-                "next_recommended_action": "Run spec_design to generate design document",
-            }
-        }
@@ -1,13 +1,32 @@
 """Data models for steering (project memory) documents."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from pathlib import Path
-
-from pydantic import BaseModel, Field, field_validator
-
-
-class SteeringFileType(str, Enum):
+from typing import Any
+
+from cc_sdd_mcp.models.clock import now
+
+# Template languages, in display order for error messages
+_SUPPORTED_LANGUAGE_CODES = (
+    "en",
+    "ja",
+    "zh-TW",
+    "zh",
+    "es",
+    "pt",
+    "de",
+    "fr",
+    "ru",
+    "it",
+    "ko",
+    "ar",
+)
+_SUPPORTED_LANGUAGES: frozenset[str] = frozenset(_SUPPORTED_LANGUAGE_CODES)
+
+
+class SteeringFileType(StrEnum):
     """Types of steering documents."""
 
     PRODUCT = "product"
@@ -16,105 +35,109 @@ class SteeringFileType(str, Enum):
     CUSTOM = "custom"
 
 
-class SteeringDocument(BaseModel):
-    """Represents a steering document (project memory)."""
+# Steering documents created by steering_init, in display order
+DEFAULT_STEERING_TYPES = (
+    SteeringFileType.PRODUCT,
+    SteeringFileType.TECH,
+    SteeringFileType.STRUCTURE,
+)
 
-    file_type: SteeringFileType = Field(..., description="Type of steering document")
-    file_path: Path = Field(..., description="Path to the steering document file")
-    content: str = Field(..., description="Content of the steering document")
-    last_modified: datetime = Field(
-        default_factory=datetime.now, description="Last modification timestamp"
-    )
+# SteeringConfig defaults, built once rather than per instance
+_DEFAULT_KIRO_DIR = Path(".kiro")
+_DEFAULT_STEERING_DIR = _DEFAULT_KIRO_DIR / "steering"
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SteeringDocument:
+    """Represents a steering document (project memory).
+
+    Example:
+        SteeringDocument(file_type=SteeringFileType.PRODUCT,
+                         file_path=Path(".kiro/steering/product.md"),
+                         content="# Product Context\\n\\nThis is the product context...")
+    """
+
+    file_type: SteeringFileType
+    file_path: Path
+    content: str
+    last_modified: datetime = field(default_factory=now)
 
-    @field_validator("content")
-    @classmethod
-    def validate_content(cls, v: str) -> str:
+    def __post_init__(self) -> None:
         """Validate content is not empty."""
-        if not v or not v.strip():
+        if not self.content or not self.content.strip():
             raise ValueError("Steering document content cannot be empty")
-        return v
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "file_type": "product",
-                "file_path": ".kiro/steering/product.md",
-                "content": "# Product Context\n\nThis is the product context...",
-                "last_modified": "2025-01-01T12:00:00",
-            }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the document to a JSON-compatible dictionary.
+
+        Returns:
+            Steering document as dictionary
+        """
+        return {
+            "file_type": self.file_type.value,
+            "file_path": str(self.file_path),
+            "content": self.content,
+            "last_modified": self.last_modified.isoformat(),
         }
 
 
-class SteeringConfig(BaseModel):
-    """Configuration for steering documents."""
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SteeringConfig:
+    """Configuration for steering documents.
 
-    kiro_dir: Path = Field(default=Path(".kiro"), description="Path to the .kiro directory")
-    steering_dir: Path = Field(
-        default=Path(".kiro/steering"), description="Path to the steering directory"
-    )
-    language: str = Field(
-        default="en", description="Language code for templates (en, ja, zh-TW, etc.)"
-    )
-    default_files: list[SteeringFileType] = Field(
-        default=[SteeringFileType.PRODUCT, SteeringFileType.TECH, SteeringFileType.STRUCTURE],
-        description="Default steering files to create",
+    Example:
+        SteeringConfig(language="ja")
+    """
+
+    kiro_dir: Path = _DEFAULT_KIRO_DIR
+    steering_dir: Path = _DEFAULT_STEERING_DIR
+    language: str = "en"  # Language code for templates (en, ja, zh-TW, etc.)
+    default_files: list[SteeringFileType] = field(
+        default_factory=lambda: list(DEFAULT_STEERING_TYPES)
     )
 
-    @field_validator("language")
-    @classmethod
-    def validate_language(cls, v: str) -> str:
+    def __post_init__(self) -> None:
         """Validate language code."""
-        supported = ["en", "ja", "zh-TW", "zh", "es", "pt", "de", "fr", "ru", "it", "ko", "ar"]
-        if v not in supported:
-            raise ValueError(f"Language {v} not supported. Supported: {supported}")
-        return v
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "kiro_dir": ".kiro",
-                "steering_dir": ".kiro/steering",
-                "language": "en",
-                "default_files": ["product", "tech", "structure"],
-            }
+        if self.language not in _SUPPORTED_LANGUAGES:
+            raise ValueError(
+                f"Language {self.language} not supported. "
+                f"Supported: {', '.join(_SUPPORTED_LANGUAGE_CODES)}"
+            )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the configuration to a JSON-compatible dictionary.
+
+        Returns:
+            Steering configuration as dictionary
+        """
+        return {
+            "kiro_dir": str(self.kiro_dir),
+            "steering_dir": str(self.steering_dir),
+            "language": self.language,
+            "default_files": [file_type.value for file_type in self.default_files],
         }
 
 
-class SteeringStatus(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SteeringStatus:
     """Status of steering documents in a project."""
 
-    exists: bool = Field(..., description="Whether steering directory exists")
-    steering_dir: Path = Field(..., description="Path to steering directory")
-    documents: list[SteeringDocument] = Field(
-        default_factory=list, description="List of steering documents found"
-    )
-    missing_defaults: list[SteeringFileType] = Field(
-        default_factory=list, description="Default files that are missing"
-    )
-    last_updated: datetime | None = Field(
-        None, description="Most recent modification time across all documents"
-    )
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "exists": True,
-                "steering_dir": ".kiro/steering",
-                "documents": [
-                    {
-                        "file_type": "product",
-                        "file_path": ".kiro/steering/product.md",
-                        "content": "# Product Context",
-                        "last_modified": "2025-01-01T12:00:00",
-                    }
-                ],
-                "missing_defaults": ["tech", "structure"],
-                "last_updated": "2025-01-01T12:00:00",
-            }
+    exists: bool
+    steering_dir: Path
+    documents: list[SteeringDocument] = field(default_factory=list)
+    missing_defaults: list[SteeringFileType] = field(default_factory=list)
+    last_updated: datetime | None = None  # Most recent modification across all documents
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the status to a JSON-compatible dictionary.
+
+        Returns:
+            Steering status as dictionary
+        """
+        return {
+            "exists": self.exists,
+            "steering_dir": str(self.steering_dir),
+            "documents": [doc.to_dict() for doc in self.documents],
+            "missing_defaults": [file_type.value for file_type in self.missing_defaults],
+            "last_updated": self.last_updated.isoformat() if self.last_updated else None,
         }
@@ -1,12 +1,14 @@
 """Data models for validation operations."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from typing import Any
 
-from pydantic import BaseModel, Field
+from cc_sdd_mcp.models.clock import now
 
 
-class ValidationSeverity(str, Enum):
+class ValidationSeverity(StrEnum):
     """Severity levels for validation issues."""
 
     INFO = "info"
@@ -15,191 +17,156 @@ class ValidationSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-class ValidationIssue(BaseModel):
-    """Represents a single validation issue."""
+# Severities that make a validation fail
+_ERROR_SEVERITIES = frozenset({ValidationSeverity.ERROR, ValidationSeverity.CRITICAL})
 
-    severity: ValidationSeverity = Field(..., description="Severity level of the issue")
-    message: str = Field(..., description="Description of the issue")
-    location: str | None = Field(
-        None, description="Location where issue was found (file path, line number, etc.)"
-    )
-    suggestion: str | None = Field(None, description="Suggested fix or action")
 
-    class Config:
-        """Pydantic configuration."""
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ValidationIssue:
+    """Represents a single validation issue.
 
-        json_schema_extra = {
-            "example": {
-                "severity": "warning",
-                "message": "Missing security consideration in design",
-                "location": "design.md:45",
-                "suggestion": "Add security considerations section",
-            }
-        }
+    Example:
+        ValidationIssue(severity=ValidationSeverity.WARNING,
+                        message="Missing security consideration in design",
+                        location="design.md:45",
+                        suggestion="Add security considerations section")
+    """
+
+    severity: ValidationSeverity
+    message: str
+    location: str | None = None  # File path, line number, etc.
+    suggestion: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the issue to a JSON-compatible dictionary.
+
+        Optional fields that are not set are left out.
 
+        Returns:
+            Validation issue as dictionary
+        """
+        data = {"severity": self.severity.value, "message": self.message}
+        if self.location is not None:
+            data["location"] = self.location
+        if self.suggestion is not None:
+            data["suggestion"] = self.suggestion
+        return data
 
-class ValidationResult(BaseModel):
-    """Result of a validation operation."""
 
-    validation_type: str = Field(
-        ..., description="Type of validation performed (gap, design, implementation)"
-    )
-    feature_name: str = Field(..., description="Feature being validated")
-    passed: bool = Field(..., description="Whether validation passed (no errors or criticals)")
-    issues: list[ValidationIssue] = Field(default_factory=list, description="List of issues found")
-    summary: str = Field(..., description="Summary of validation results")
-    validated_at: datetime = Field(default_factory=datetime.now, description="Validation timestamp")
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ValidationResult:
+    """Result of a validation operation.
+
+    ``passed`` means no errors or criticals were found.
+    """
+
+    validation_type: str  # gap, design, implementation
+    feature_name: str
+    passed: bool
+    issues: list[ValidationIssue] = field(default_factory=list)
+    summary: str
+    validated_at: datetime = field(default_factory=now)
 
     @property
     def error_count(self) -> int:
         """Count of error-level issues."""
-        return sum(
-            1
-            for issue in self.issues
-            if issue.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]
-        )
+        return sum(1 for issue in self.issues if issue.severity in _ERROR_SEVERITIES)
 
     @property
     def warning_count(self) -> int:
         """Count of warning-level issues."""
-        return sum(1 for issue in self.issues if issue.severity == ValidationSeverity.WARNING)
+        return sum(1 for issue in self.issues if issue.severity is ValidationSeverity.WARNING)
 
     @property
     def info_count(self) -> int:
         """Count of info-level issues."""
-        return sum(1 for issue in self.issues if issue.severity == ValidationSeverity.INFO)
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "validation_type": "design",
-                "feature_name": "user-authentication",
-                "passed": True,
-                "issues": [
-                    {
-                        "severity": "warning",
-                        "message": "Consider adding rate limiting",
-                        "location": "design.md:45",
-                        "suggestion": "Add rate limiting to OAuth endpoints",
-                    }
-                ],
-                "summary": "Design validation passed with 1 warning",
-                "validated_at": "2025-01-01T12:00:00",
-            }
+        return sum(1 for issue in self.issues if issue.severity is ValidationSeverity.INFO)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to a JSON-compatible dictionary.
+
+        Returns:
+            Validation result as dictionary
+        """
+        return {
+            "validation_type": self.validation_type,
+            "feature_name": self.feature_name,
+            "passed": self.passed,
+            "issues": [issue.to_dict() for issue in self.issues],
+            "summary": self.summary,
+            "validated_at": self.validated_at.isoformat(),
         }
 
 
+# Subclass to_dict() methods call ValidationResult.to_dict(self) explicitly:
+# zero-argument super() does not work in slotted dataclasses.
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class GapAnalysisResult(ValidationResult):
     """Result of gap analysis between existing code and requirements."""
 
-    existing_implementations: list[str] = Field(
-        default_factory=list, description="Existing implementations found in codebase"
-    )
-    missing_requirements: list[str] = Field(
-        default_factory=list, description="Requirements not implemented"
-    )
-    conflicting_implementations: list[str] = Field(
-        default_factory=list, description="Implementations that conflict with requirements"
-    )
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "validation_type": "gap",
-                "feature_name": "user-authentication",
-                "passed": False,
-                "issues": [
-                    {
-                        "severity": "error",
-                        "message": "OAuth provider configuration missing",
-                        "location": "requirements.md:3",
-                        "suggestion": "Implement OAuth configuration module",
-                    }
-                ],
-                "summary": "Gap analysis found 3 missing requirements",
-                "validated_at": "2025-01-01T12:00:00",
-                "existing_implementations": ["Basic username/password authentication"],
-                "missing_requirements": [
-                    "OAuth Google integration",
-                    "OAuth GitHub integration",
-                    "Session management",
-                ],
-                "conflicting_implementations": ["Current auth uses sessions, design specifies JWT"],
-            }
-        }
+    existing_implementations: list[str] = field(default_factory=list)
+    missing_requirements: list[str] = field(default_factory=list)
+    conflicting_implementations: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to a JSON-compatible dictionary.
 
+        Returns:
+            Gap analysis result as dictionary
+        """
+        data = ValidationResult.to_dict(self)
+        data["existing_implementations"] = self.existing_implementations
+        data["missing_requirements"] = self.missing_requirements
+        data["conflicting_implementations"] = self.conflicting_implementations
+        return data
 
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class DesignValidationResult(ValidationResult):
     """Result of design document validation."""
 
-    requirements_coverage: float = Field(
-        ..., description="Percentage of requirements covered by design (0-100)"
-    )
-    missing_components: list[str] = Field(
-        default_factory=list,
-        description="Components mentioned in requirements but missing from design",
-    )
-    design_completeness: float = Field(
-        ..., description="Completeness score of design document (0-100)"
-    )
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "validation_type": "design",
-                "feature_name": "user-authentication",
-                "passed": True,
-                "issues": [],
-                "summary": "Design covers 95% of requirements",
-                "validated_at": "2025-01-01T12:00:00",
-                "requirements_coverage": 95.0,
-                "missing_components": ["Session cleanup service"],
-                "design_completeness": 90.0,
-            }
-        }
+    requirements_coverage: float  # Percentage of requirements covered by design (0-100)
+    missing_components: list[str] = field(default_factory=list)
+    design_completeness: float  # Completeness score of design document (0-100)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to a JSON-compatible dictionary.
 
+        Returns:
+            Design validation result as dictionary
+        """
+        data = ValidationResult.to_dict(self)
+        data["requirements_coverage"] = self.requirements_coverage
+        data["missing_components"] = self.missing_components
+        data["design_completeness"] = self.design_completeness
+        return data
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ImplementationValidationResult(ValidationResult):
     """Result of implementation validation against tasks."""
 
-    tasks_completed: int = Field(..., description="Number of tasks completed")
-    tasks_total: int = Field(..., description="Total number of tasks")
-    completion_percentage: float = Field(..., description="Percentage of tasks completed (0-100)")
-    incomplete_tasks: list[str] = Field(
-        default_factory=list, description="Task IDs that are incomplete"
-    )
-    test_coverage: float | None = Field(
-        None, description="Code test coverage percentage if available"
-    )
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "validation_type": "implementation",
-                "feature_name": "user-authentication",
-                "passed": False,
-                "issues": [
-                    {
-                        "severity": "error",
-                        "message": "Task 1.3 not implemented",
-                        "location": "tasks.md:15",
-                        "suggestion": "Implement OAuth callback handler",
-                    }
-                ],
-                "summary": "Implementation 75% complete",
-                "validated_at": "2025-01-01T12:00:00",
-                "tasks_completed": 6,
-                "tasks_total": 8,
-                "completion_percentage": 75.0,
-                "incomplete_tasks": ["1.3", "2.2"],
-                "test_coverage": 82.5,
-            }
-        }
+    tasks_completed: int
+    tasks_total: int
+    completion_percentage: float  # 0-100
+    incomplete_tasks: list[str] = field(default_factory=list)  # Task IDs
+    test_coverage: float | None = None  # Code test coverage percentage if available
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to a JSON-compatible dictionary.
+
+        ``test_coverage`` is left out when it is not available.
+
+        Returns:
+            Implementation validation result as dictionary
+        """
+        data = ValidationResult.to_dict(self)
+        data["tasks_completed"] = self.tasks_completed
+        data["tasks_total"] = self.tasks_total
+        data["completion_percentage"] = self.completion_percentage
+        data["incomplete_tasks"] = self.incomplete_tasks
+        if self.test_coverage is not None:
+            data["test_coverage"] = self.test_coverage
+        return data
@@ -1,6 +1,6 @@
 """MCP server implementation for cc-sdd."""
 
-import json
+import functools
 import logging
 from collections.abc import Sequence
 from typing import Any
@@ -15,10 +15,17 @@ from mcp.types import (
 )
 
 from cc_sdd_mcp.models.config import ServerConfig
-from cc_sdd_mcp.tools.registry import get_all_tools, get_tool_handler
+from cc_sdd_mcp.tools.registry import _TOOL_HANDLERS, get_all_tools, get_tool_handler
+from cc_sdd_mcp.utils.serialization import PRETTY_JSON, dumps
 
-# Global configuration
-_server_config: ServerConfig | None = None
+# Configuration set explicitly via set_config(), taking precedence over the default
+_config_override: ServerConfig | None = None
+
+
+@functools.cache
+def _load_default_config() -> ServerConfig:
+    """Load the default server configuration once per process."""
+    return ServerConfig.load()
 
 
 def get_config() -> ServerConfig:
@@ -27,10 +34,9 @@ def get_config() -> ServerConfig:
     Returns:
         Current server configuration
     """
-    global _server_config
-    if _server_config is None:
-        _server_config = ServerConfig.load()
-    return _server_config
+    if _config_override is not None:
+        return _config_override
+    return _load_default_config()
 
 
 def set_config(config: ServerConfig) -> None:
@@ -39,19 +45,41 @@ def set_config(config: ServerConfig) -> None:
     Args:
         config: Server configuration to use
     """
-    global _server_config
-    _server_config = config
+    global _config_override
+    _config_override = config
 
 
-# Configure logging from config
-config = get_config()
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Configure logging from config, unless the embedding application already has
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=getattr(logging, get_config().log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
 logger = logging.getLogger(__name__)
 
 
+def format_result(result: Any, *, pretty: bool) -> str:
+    """Format a tool handler result as response text.
+
+    Args:
+        result: Value returned by the tool handler
+        pretty: Indent JSON output (responses are read by the MCP client,
+            so this is only worth it when debugging)
+
+    Returns:
+        Response text
+    """
+    if isinstance(result, str):
+        return result
+    if isinstance(result, dict):
+        return dumps(result, indent=pretty)
+    if hasattr(result, "to_dict"):
+        # Dataclass result models
+        return dumps(result.to_dict(), indent=pretty)
+    # Assume it's a Pydantic model
+    return result.model_dump_json(indent=2 if pretty else None)
+
+
 def create_server(config: ServerConfig | None = None) -> Server:
     """Create and configure the MCP server.
 
@@ -72,15 +100,15 @@ def create_server(config: ServerConfig | None = None) -> Server:
     logger.info(f"Log level: {current_config.log_level}")
 
     @server.list_tools()
-    async def list_tools() -> list[Tool]:
+    async def list_tools() -> tuple[Tool, ...]:
         """List all available cc-sdd tools.
 
         Returns:
-            List of Tool definitions with their schemas
+            Tuple of Tool definitions with their schemas
         """
         logger.info("Listing available tools")
         tools = get_all_tools()
-        logger.info(f"Found {len(tools)} tools")
+        logger.info("Found %d tools", len(tools))
         return tools
 
     @server.call_tool()
@@ -99,33 +127,32 @@ def create_server(config: ServerConfig | None = None) -> Server:
         Raises:
             ValueError: If tool is not found or arguments are invalid
         """
-        logger.info(f"Calling tool: {name} with arguments: {arguments}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Calling tool: %s with arguments: %s", name, arguments)
 
+        # Get the tool handler
         try:
-            # Get the tool handler
+            handler = _TOOL_HANDLERS[name]
+        except KeyError:
+            # Tool modules may not be loaded yet; get_tool_handler loads them
             handler = get_tool_handler(name)
             if handler is None:
-                raise ValueError(f"Unknown tool: {name}")
+                error_msg = f"Error executing tool {name}: Unknown tool: {name}"
+                logger.error(error_msg)
+                raise ValueError(error_msg) from None
 
-            # Execute the tool handler
+        try:
             result = await handler(arguments)
-
-            # Format result as TextContent
-            if isinstance(result, str):
-                content = result
-            elif isinstance(result, dict):
-                content = json.dumps(result, indent=2)
-            else:
-                # Assume it's a Pydantic model
-                content = result.model_dump_json(indent=2)
-
-            logger.info(f"Tool {name} executed successfully")
-            return [TextContent(type="text", text=content)]
-
+            pretty = PRETTY_JSON or logger.isEnabledFor(logging.DEBUG)
+            content = format_result(result, pretty=pretty)
         except Exception as e:
             error_msg = f"Error executing tool {name}: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            raise ValueError(error_msg) from e
+            # The client only sees the message; format tracebacks only when debugging
+            logger.error(error_msg, exc_info=logger.isEnabledFor(logging.DEBUG))
+            raise ValueError(error_msg) from None
+
+        logger.info("Tool %s executed successfully", name)
+        return [TextContent(type="text", text=content)]
 
     return server
 
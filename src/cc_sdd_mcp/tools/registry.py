@@ -1,7 +1,9 @@
 """Tool registry for managing MCP tool definitions and handlers."""
 
-import contextlib
-from collections.abc import Awaitable, Callable
+import functools
+import importlib
+import sys
+from collections.abc import Awaitable, Callable, Iterable
 from typing import Any
 
 from mcp.types import Tool
@@ -9,12 +11,100 @@ from mcp.types import Tool
 # Type alias for tool handler functions
 ToolHandler = Callable[[dict[str, Any]], Awaitable[Any]]
 
-# Registry of tool handlers
+# Registry of tool handlers (the server dispatches on this dict directly)
 _TOOL_HANDLERS: dict[str, ToolHandler] = {}
 
 # Registry of tool definitions
 _TOOL_DEFINITIONS: dict[str, Tool] = {}
 
+# Immutable view of _TOOL_DEFINITIONS, rebuilt lazily after registry changes
+_TOOLS_SNAPSHOT: tuple[Tool, ...] | None = None
+
+# Built-in tool modules under cc_sdd_mcp.tools, registered in this order
+_TOOL_MODULES = ("steering", "specification", "validation", "templates")
+
+# Whether the built-in tool modules have been registered
+_LOADED = False
+
+
+@functools.cache
+def feature_schema(*, auto_approve: bool = False) -> dict[str, Any]:
+    """Build the input schema shared by the per-feature spec and validation tools.
+
+    Identical schemas are built once and shared; tool schemas are only read.
+
+    Args:
+        auto_approve: Include the optional auto_approve flag
+
+    Returns:
+        JSON schema requiring feature_name, with an optional project_dir
+    """
+    properties: dict[str, Any] = {
+        "feature_name": {"type": "string", "description": "Name of the feature"},
+        "project_dir": {
+            "type": "string",
+            "description": "Project directory (defaults to current directory)",
+        },
+    }
+    if auto_approve:
+        properties["auto_approve"] = {
+            "type": "boolean",
+            "description": "Auto-approve and move to next phase (default: false)",
+        }
+    return {"type": "object", "properties": properties, "required": ["feature_name"]}
+
+
+def require_args(*names: str) -> Callable[[ToolHandler], ToolHandler]:
+    """Decorate a tool handler to reject calls missing required arguments.
+
+    The wrapped handler can index ``arguments`` directly for the named keys.
+
+    Args:
+        *names: Argument names that must be present and non-empty
+
+    Returns:
+        Decorator applying the check
+
+    Raises:
+        ValueError: From the wrapped handler, if a required argument is missing
+    """
+    if len(names) == 1:
+        message = f"{names[0]} is required"
+    else:
+        message = f"Both {' and '.join(names)} are required"
+
+    def decorator(handler: ToolHandler) -> ToolHandler:
+        @functools.wraps(handler)
+        async def wrapper(arguments: dict[str, Any]) -> Any:
+            for name in names:
+                if not arguments.get(name):
+                    raise ValueError(message)
+            return await handler(arguments)
+
+        return wrapper
+
+    return decorator
+
+
+def _ensure_tools_loaded() -> None:
+    """Register the built-in tool modules on first use.
+
+    Each module in _TOOL_MODULES exposes a register() function. Deferring
+    the imports keeps model and template machinery out of the startup path
+    until a client first asks for tools.
+    """
+    global _LOADED
+    if _LOADED:
+        return
+    _LOADED = True
+
+    for module_name in _TOOL_MODULES:
+        try:
+            module = importlib.import_module(f"cc_sdd_mcp.tools.{module_name}")
+        except ImportError:
+            continue
+        module.register()
+
 
 def register_tool(tool: Tool, handler: ToolHandler) -> None:
     """Register a tool with its handler.
@@ -23,8 +113,22 @@ def register_tool(tool: Tool, handler: ToolHandler) -> None:
         tool: Tool definition with name, description, and inputSchema
         handler: Async function that handles tool invocation
     """
-    _TOOL_DEFINITIONS[tool.name] = tool
-    _TOOL_HANDLERS[tool.name] = handler
+    register_tools([(tool, handler)])
+
+
+def register_tools(tools: Iterable[tuple[Tool, ToolHandler]]) -> None:
+    """Register several tools with their handlers in one registry update.
+
+    Args:
+        tools: (tool definition, handler) pairs, in listing order
+    """
+    global _TOOLS_SNAPSHOT
+    for tool, handler in tools:
+        # Interned keys let lookups with the same name hit the identity fast path
+        name = sys.intern(tool.name)
+        _TOOL_DEFINITIONS[name] = tool
+        _TOOL_HANDLERS[name] = handler
+    _TOOLS_SNAPSHOT = None
 
 
 def get_tool_handler(name: str) -> ToolHandler | None:
@@ -36,36 +140,46 @@ def get_tool_handler(name: str) -> ToolHandler | None:
     Returns:
         Tool handler function, or None if not found
     """
+    _ensure_tools_loaded()
     return _TOOL_HANDLERS.get(name)
 
 
-def get_all_tools() -> list[Tool]:
-    """Get all registered tool definitions.
+def get_tool(name: str) -> Tool | None:
+    """Get a tool definition by name.
+
+    Args:
+        name: Name of the tool
 
     Returns:
-        List of all registered Tool definitions
+        Tool definition, or None if not found
     """
-    return list(_TOOL_DEFINITIONS.values())
+    _ensure_tools_loaded()
+    return _TOOL_DEFINITIONS.get(name)
 
 
-def clear_registry() -> None:
-    """Clear all registered tools (useful for testing)."""
-    _TOOL_HANDLERS.clear()
-    _TOOL_DEFINITIONS.clear()
-
+def get_all_tools() -> tuple[Tool, ...]:
+    """Get all registered tool definitions.
 
-# Import tool modules to register them
-# These imports will trigger tool registration via decorators or direct calls
-# For now, we'll add them as we implement each tool module
+    The tuple is cached until the next registry change, so repeated calls
+    return the same object.
 
-with contextlib.suppress(ImportError):
-    from cc_sdd_mcp.tools import steering  # noqa: F401
+    Returns:
+        Tuple of all registered Tool definitions
+    """
+    global _TOOLS_SNAPSHOT
+    _ensure_tools_loaded()
+    if _TOOLS_SNAPSHOT is None:
+        _TOOLS_SNAPSHOT = tuple(_TOOL_DEFINITIONS.values())
+    return _TOOLS_SNAPSHOT
 
-with contextlib.suppress(ImportError):
-    from cc_sdd_mcp.tools import specification  # noqa: F401
 
-with contextlib.suppress(ImportError):
-    from cc_sdd_mcp.tools import validation  # noqa: F401
+def clear_registry() -> None:
+    """Clear all registered tools (useful for testing).
 
-with contextlib.suppress(ImportError):
-    from cc_sdd_mcp.tools import templates  # noqa: F401
+    The built-in tools are registered again on the next registry lookup.
+    """
+    global _TOOLS_SNAPSHOT, _LOADED
+    _TOOL_HANDLERS.clear()
+    _TOOL_DEFINITIONS.clear()
+    _TOOLS_SNAPSHOT = None
+    _LOADED = False
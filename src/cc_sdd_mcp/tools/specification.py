@@ -1,25 +1,26 @@
 """MCP tools for specification lifecycle management."""
 
-import json
 import logging
-from pathlib import Path
 from typing import Any
 
 from mcp.types import Tool
 
+from cc_sdd_mcp.models.clock import frozen_now
 from cc_sdd_mcp.models.specification import (
     SpecificationMetadata,
     SpecPhase,
 )
 from cc_sdd_mcp.models.steering import SteeringConfig
-from cc_sdd_mcp.tools.registry import register_tool
-from cc_sdd_mcp.workflows.spec_workflow import SpecWorkflow
+from cc_sdd_mcp.tools.registry import feature_schema, register_tools, require_args
+from cc_sdd_mcp.utils.paths import ensure_directory_exists, resolve_project_dir
+from cc_sdd_mcp.workflows.spec_workflow import get_spec_workflow, write_metadata_file
 
 logger = logging.getLogger(__name__)
 
 
 # Tool: spec_init
-async def spec_init_handler(arguments: dict[str, Any]) -> str:
+@require_args("feature_name", "description")
+async def spec_init_handler(arguments: dict[str, Any]) -> dict[str, Any]:
     """Initialize a new feature specification.
 
     Args:
@@ -29,43 +30,37 @@ async def spec_init_handler(arguments: dict[str, Any]) -> str:
             - project_dir: Optional project directory
 
     Returns:
-        JSON string with initialization result
+        Dictionary with initialization result
     """
-    feature_name = arguments.get("feature_name")
-    description = arguments.get("description")
-    project_dir = Path(arguments.get("project_dir", "."))
-
-    if not feature_name or not description:
-        raise ValueError("Both feature_name and description are required")
+    feature_name = arguments["feature_name"]
+    description = arguments["description"]
+    project_dir = resolve_project_dir(arguments.get("project_dir", "."))
 
     # Initialize spec
     config = SteeringConfig()
 
     # Create metadata
-    metadata = SpecificationMetadata(
-        feature_name=feature_name, description=description, current_phase=SpecPhase.INITIALIZED
-    )
+    with frozen_now():
+        metadata = SpecificationMetadata(
+            feature_name=feature_name, description=description, current_phase=SpecPhase.INITIALIZED
+        )
 
     # Create spec directory
     spec_dir = project_dir / config.kiro_dir / "specs" / metadata.feature_name
-    spec_dir.mkdir(parents=True, exist_ok=True)
+    ensure_directory_exists(spec_dir)
 
     # Write metadata
-    metadata_file = spec_dir / "metadata.json"
-    metadata_file.write_text(metadata.model_dump_json(indent=2))
+    write_metadata_file(spec_dir / "metadata.json", metadata)
 
     logger.info(f"Initialized specification: {metadata.feature_name}")
 
-    return json.dumps(
-        {
-            "success": True,
-            "feature_name": metadata.feature_name,
-            "spec_dir": str(spec_dir),
-            "current_phase": metadata.current_phase.value,
-            "message": f"Specification '{metadata.feature_name}' initialized successfully",
-        },
-        indent=2,
-    )
+    return {
+        "success": True,
+        "feature_name": metadata.feature_name,
+        "spec_dir": str(spec_dir),
+        "current_phase": metadata.current_phase.value,
+        "message": f"Specification '{metadata.feature_name}' initialized successfully",
+    }
 
 
 spec_init_tool = Tool(
@@ -88,11 +83,10 @@ spec_init_tool = Tool(
     },
 )
 
-register_tool(spec_init_tool, spec_init_handler)
-
 
 # Tool: spec_requirements
-async def spec_requirements_handler(arguments: dict[str, Any]) -> str:
+@require_args("feature_name")
+async def spec_requirements_handler(arguments: dict[str, Any]) -> dict[str, Any]:
     """Generate requirements document for a specification.
 
     Args:
@@ -102,46 +96,28 @@ async def spec_requirements_handler(arguments: dict[str, Any]) -> str:
             - auto_approve: Optional auto-approval flag
 
     Returns:
-        JSON string with requirements generation result
+        Dictionary with requirements generation result
     """
-    feature_name = arguments.get("feature_name")
-    project_dir = Path(arguments.get("project_dir", "."))
+    feature_name = arguments["feature_name"]
+    project_dir = resolve_project_dir(arguments.get("project_dir", "."))
     auto_approve = arguments.get("auto_approve", False)
 
-    if not feature_name:
-        raise ValueError("feature_name is required")
-
-    workflow = SpecWorkflow(project_dir)
+    workflow = get_spec_workflow(project_dir)
     result = await workflow.generate_requirements(feature_name, auto_approve=auto_approve)
 
-    return json.dumps(result, indent=2)
+    return result
 
 
 spec_requirements_tool = Tool(
     name="spec_requirements",
     description="Generate requirements document for a feature specification",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "feature_name": {"type": "string", "description": "Name of the feature"},
-            "project_dir": {
-                "type": "string",
-                "description": "Project directory (defaults to current directory)",
-            },
-            "auto_approve": {
-                "type": "boolean",
-                "description": "Auto-approve and move to next phase (default: false)",
-            },
-        },
-        "required": ["feature_name"],
-    },
+    inputSchema=feature_schema(auto_approve=True),
 )
 
-register_tool(spec_requirements_tool, spec_requirements_handler)
-
 
 # Tool: spec_design
-async def spec_design_handler(arguments: dict[str, Any]) -> str:
+@require_args("feature_name")
+async def spec_design_handler(arguments: dict[str, Any]) -> dict[str, Any]:
     """Generate design document for a specification.
 
     Args:
@@ -151,46 +127,28 @@ async def spec_design_handler(arguments: dict[str, Any]) -> str:
             - auto_approve: Optional auto-approval flag
 
     Returns:
-        JSON string with design generation result
+        Dictionary with design generation result
     """
-    feature_name = arguments.get("feature_name")
-    project_dir = Path(arguments.get("project_dir", "."))
+    feature_name = arguments["feature_name"]
+    project_dir = resolve_project_dir(arguments.get("project_dir", "."))
     auto_approve = arguments.get("auto_approve", False)
 
-    if not feature_name:
-        raise ValueError("feature_name is required")
-
-    workflow = SpecWorkflow(project_dir)
+    workflow = get_spec_workflow(project_dir)
     result = await workflow.generate_design(feature_name, auto_approve=auto_approve)
 
-    return json.dumps(result, indent=2)
+    return result
 
 
 spec_design_tool = Tool(
     name="spec_design",
     description="Generate design document for a feature specification",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "feature_name": {"type": "string", "description": "Name of the feature"},
-            "project_dir": {
-                "type": "string",
-                "description": "Project directory (defaults to current directory)",
-            },
-            "auto_approve": {
-                "type": "boolean",
-                "description": "Auto-approve and move to next phase (default: false)",
-            },
-        },
-        "required": ["feature_name"],
-    },
+    inputSchema=feature_schema(auto_approve=True),
 )
 
-register_tool(spec_design_tool, spec_design_handler)
-
 
 # Tool: spec_tasks
-async def spec_tasks_handler(arguments: dict[str, Any]) -> str:
+@require_args("feature_name")
+async def spec_tasks_handler(arguments: dict[str, Any]) -> dict[str, Any]:
     """Generate task breakdown for a specification.
 
     Args:
@@ -200,46 +158,28 @@ async def spec_tasks_handler(arguments: dict[str, Any]) -> str:
             - auto_approve: Optional auto-approval flag
 
     Returns:
-        JSON string with tasks generation result
+        Dictionary with tasks generation result
     """
-    feature_name = arguments.get("feature_name")
-    project_dir = Path(arguments.get("project_dir", "."))
+    feature_name = arguments["feature_name"]
+    project_dir = resolve_project_dir(arguments.get("project_dir", "."))
     auto_approve = arguments.get("auto_approve", False)
 
-    if not feature_name:
-        raise ValueError("feature_name is required")
-
-    workflow = SpecWorkflow(project_dir)
+    workflow = get_spec_workflow(project_dir)
     result = await workflow.generate_tasks(feature_name, auto_approve=auto_approve)
 
-    return json.dumps(result, indent=2)
+    return result
 
 
 spec_tasks_tool = Tool(
     name="spec_tasks",
     description="Generate task breakdown for a feature specification",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "feature_name": {"type": "string", "description": "Name of the feature"},
-            "project_dir": {
-                "type": "string",
-                "description": "Project directory (defaults to current directory)",
-            },
-            "auto_approve": {
-                "type": "boolean",
-                "description": "Auto-approve and move to next phase (default: false)",
-            },
-        },
-        "required": ["feature_name"],
-    },
+    inputSchema=feature_schema(auto_approve=True),
 )
 
-register_tool(spec_tasks_tool, spec_tasks_handler)
-
 
 # Tool: spec_status
-async def spec_status_handler(arguments: dict[str, Any]) -> str:
+@require_args("feature_name")
+async def spec_status_handler(arguments: dict[str, Any]) -> dict[str, Any]:
     """Check status of a feature specification.
 
     Args:
@@ -248,34 +188,32 @@ async def spec_status_handler(arguments: dict[str, Any]) -> str:
             - project_dir: Optional project directory
 
     Returns:
-        JSON string with specification status
+        Dictionary with specification status
     """
-    feature_name = arguments.get("feature_name")
-    project_dir = Path(arguments.get("project_dir", "."))
-
-    if not feature_name:
-        raise ValueError("feature_name is required")
+    feature_name = arguments["feature_name"]
+    project_dir = resolve_project_dir(arguments.get("project_dir", "."))
 
-    workflow = SpecWorkflow(project_dir)
+    workflow = get_spec_workflow(project_dir)
     status = await workflow.get_spec_status(feature_name)
 
-    return json.dumps(status, indent=2)
+    return status
 
 
 spec_status_tool = Tool(
     name="spec_status",
     description="Check the current status of a feature specification",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "feature_name": {"type": "string", "description": "Name of the feature"},
-            "project_dir": {
-                "type": "string",
-                "description": "Project directory (defaults to current directory)",
-            },
-        },
-        "required": ["feature_name"],
-    },
+    inputSchema=feature_schema(),
 )
 
-register_tool(spec_status_tool, spec_status_handler)
+
+def register() -> None:
+    """Register the specification tools with the tool registry."""
+    register_tools(
+        [
+            (spec_init_tool, spec_init_handler),
+            (spec_requirements_tool, spec_requirements_handler),
+            (spec_design_tool, spec_design_handler),
+            (spec_tasks_tool, spec_tasks_handler),
+            (spec_status_tool, spec_status_handler),
+        ]
+    )
@@ -1,14 +1,14 @@
 """MCP tools for template management."""
 
-import json
 import logging
-from pathlib import Path
 from typing import Any
 
 from mcp.types import Tool
 
-from cc_sdd_mcp.tools.registry import register_tool
-from cc_sdd_mcp.utils.templates import TemplateLoader
+from cc_sdd_mcp.tools.registry import register_tools, require_args
+from cc_sdd_mcp.utils.paths import resolve_project_dir
+from cc_sdd_mcp.utils.serialization import dumps
+from cc_sdd_mcp.utils.templates import get_template_loader
 
 logger = logging.getLogger(__name__)
 
@@ -25,20 +25,19 @@ async def template_list_handler(arguments: dict[str, Any]) -> str:
     Returns:
         JSON string with list of templates
     """
-    project_dir = Path(arguments.get("project_dir", "."))
+    project_dir = resolve_project_dir(arguments.get("project_dir", "."))
     category = arguments.get("category")
 
-    loader = TemplateLoader(project_dir=project_dir)
+    loader = get_template_loader(project_dir)
     templates = loader.list_templates(category=category)
 
-    return json.dumps(
+    return dumps(
         {
             "success": True,
             "count": len(templates),
             "templates": templates,
             "category_filter": category,
-        },
-        indent=2,
+        }
     )
 
 
@@ -61,10 +60,9 @@ template_list_tool = Tool(
     },
 )
 
-register_tool(template_list_tool, template_list_handler)
-
 
 # Tool: template_get
+@require_args("template_name")
 async def template_get_handler(arguments: dict[str, Any]) -> str:
     """Get raw template content.
 
@@ -77,38 +75,31 @@ async def template_get_handler(arguments: dict[str, Any]) -> str:
     Returns:
         JSON string with template content
     """
-    template_name = arguments.get("template_name")
+    template_name = arguments["template_name"]
     template_type = arguments.get("template_type", "steering")
-    project_dir = Path(arguments.get("project_dir", "."))
-
-    if not template_name:
-        raise ValueError("template_name is required")
+    project_dir = resolve_project_dir(arguments.get("project_dir", "."))
 
-    loader = TemplateLoader(project_dir=project_dir)
-
-    # Load template based on type
+    loader = get_template_loader(project_dir)
     if template_type == "steering":
         content = loader.load_steering_template(template_name)
     else:
         content = loader.load_spec_template(template_name, spec_type=template_type)
 
     if content is None:
-        return json.dumps(
+        return dumps(
             {
                 "success": False,
                 "error": f"Template '{template_name}' not found for type '{template_type}'",
-            },
-            indent=2,
+            }
         )
 
-    return json.dumps(
+    return dumps(
         {
             "success": True,
             "template_name": template_name,
             "template_type": template_type,
             "content": content,
-        },
-        indent=2,
+        }
     )
 
 
@@ -135,10 +126,9 @@ template_get_tool = Tool(
     },
 )
 
-register_tool(template_get_tool, template_get_handler)
-
 
 # Tool: template_render
+@require_args("template_content")
 async def template_render_handler(arguments: dict[str, Any]) -> str:
     """Render a template with context variables.
 
@@ -152,15 +142,12 @@ async def template_render_handler(arguments: dict[str, Any]) -> str:
     Returns:
         JSON string with rendered content
     """
-    template_content = arguments.get("template_content")
+    template_content = arguments["template_content"]
     context = arguments.get("context", {})
     use_file = arguments.get("use_file", False)
-    project_dir = Path(arguments.get("project_dir", "."))
-
-    if not template_content:
-        raise ValueError("template_content is required")
+    project_dir = resolve_project_dir(arguments.get("project_dir", "."))
 
-    loader = TemplateLoader(project_dir=project_dir)
+    loader = get_template_loader(project_dir)
 
     try:
         if use_file:
@@ -170,15 +157,11 @@ async def template_render_handler(arguments: dict[str, Any]) -> str:
             # Render from string
             rendered = loader.render_jinja_template(template_content, context)
 
-        return json.dumps(
-            {"success": True, "rendered_content": rendered, "context_used": context}, indent=2
-        )
+        return dumps({"success": True, "rendered_content": rendered, "context_used": context})
 
     except Exception as e:
         logger.error(f"Template rendering failed: {e}")
-        return json.dumps(
-            {"success": False, "error": f"Failed to render template: {str(e)}"}, indent=2
-        )
+        return dumps({"success": False, "error": f"Failed to render template: {str(e)}"})
 
 
 template_render_tool = Tool(
@@ -208,4 +191,13 @@ template_render_tool = Tool(
     },
 )
 
-register_tool(template_render_tool, template_render_handler)
+
+def register() -> None:
+    """Register the template tools with the tool registry."""
+    register_tools(
+        [
+            (template_list_tool, template_list_handler),
+            (template_get_tool, template_get_handler),
+            (template_render_tool, template_render_handler),
+        ]
+    )
@@ -1,19 +1,25 @@
 """MCP tools for specification validation."""
 
 import logging
-from pathlib import Path
 from typing import Any
 
 from mcp.types import Tool
 
-from cc_sdd_mcp.tools.registry import register_tool
-from cc_sdd_mcp.workflows.validation_workflow import ValidationWorkflow
+from cc_sdd_mcp.models.validation import (
+    DesignValidationResult,
+    GapAnalysisResult,
+    ImplementationValidationResult,
+)
+from cc_sdd_mcp.tools.registry import feature_schema, register_tools, require_args
+from cc_sdd_mcp.utils.paths import resolve_project_dir
+from cc_sdd_mcp.workflows.validation_workflow import get_validation_workflow
 
 logger = logging.getLogger(__name__)
 
 
 # Tool: validate_gap
-async def validate_gap_handler(arguments: dict[str, Any]) -> str:
+@require_args("feature_name")
+async def validate_gap_handler(arguments: dict[str, Any]) -> GapAnalysisResult:
     """Analyze gap between existing code and requirements.
 
     Args:
@@ -22,41 +28,27 @@ async def validate_gap_handler(arguments: dict[str, Any]) -> str:
             - project_dir: Optional project directory
 
     Returns:
-        JSON string with gap analysis result
+        GapAnalysisResult object
     """
-    feature_name = arguments.get("feature_name")
-    project_dir = Path(arguments.get("project_dir", "."))
-
-    if not feature_name:
-        raise ValueError("feature_name is required")
+    feature_name = arguments["feature_name"]
+    project_dir = resolve_project_dir(arguments.get("project_dir", "."))
 
-    workflow = ValidationWorkflow(project_dir)
+    workflow = get_validation_workflow(project_dir)
     result = await workflow.validate_gap(feature_name)
 
-    return result.model_dump_json(indent=2)
+    return result
 
 
 validate_gap_tool = Tool(
     name="validate_gap",
     description="Analyze the gap between existing codebase and requirements",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "feature_name": {"type": "string", "description": "Name of the feature"},
-            "project_dir": {
-                "type": "string",
-                "description": "Project directory (defaults to current directory)",
-            },
-        },
-        "required": ["feature_name"],
-    },
+    inputSchema=feature_schema(),
 )
 
-register_tool(validate_gap_tool, validate_gap_handler)
-
 
 # Tool: validate_design
-async def validate_design_handler(arguments: dict[str, Any]) -> str:
+@require_args("feature_name")
+async def validate_design_handler(arguments: dict[str, Any]) -> DesignValidationResult:
     """Validate design document against requirements.
 
     Args:
@@ -65,41 +57,27 @@ async def validate_design_handler(arguments: dict[str, Any]) -> str:
             - project_dir: Optional project directory
 
     Returns:
-        JSON string with design validation result
+        DesignValidationResult object
     """
-    feature_name = arguments.get("feature_name")
-    project_dir = Path(arguments.get("project_dir", "."))
-
-    if not feature_name:
-        raise ValueError("feature_name is required")
+    feature_name = arguments["feature_name"]
+    project_dir = resolve_project_dir(arguments.get("project_dir", "."))
 
-    workflow = ValidationWorkflow(project_dir)
+    workflow = get_validation_workflow(project_dir)
     result = await workflow.validate_design(feature_name)
 
-    return result.model_dump_json(indent=2)
+    return result
 
 
 validate_design_tool = Tool(
     name="validate_design",
     description="Validate design document completeness and alignment with requirements",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "feature_name": {"type": "string", "description": "Name of the feature"},
-            "project_dir": {
-                "type": "string",
-                "description": "Project directory (defaults to current directory)",
-            },
-        },
-        "required": ["feature_name"],
-    },
+    inputSchema=feature_schema(),
 )
 
-register_tool(validate_design_tool, validate_design_handler)
-
 
 # Tool: validate_impl
-async def validate_impl_handler(arguments: dict[str, Any]) -> str:
+@require_args("feature_name")
+async def validate_impl_handler(arguments: dict[str, Any]) -> ImplementationValidationResult:
     """Validate implementation against task breakdown.
 
     Args:
@@ -108,34 +86,30 @@ async def validate_impl_handler(arguments: dict[str, Any]) -> str:
             - project_dir: Optional project directory
 
     Returns:
-        JSON string with implementation validation result
+        ImplementationValidationResult object
     """
-    feature_name = arguments.get("feature_name")
-    project_dir = Path(arguments.get("project_dir", "."))
-
-    if not feature_name:
-        raise ValueError("feature_name is required")
+    feature_name = arguments["feature_name"]
+    project_dir = resolve_project_dir(arguments.get("project_dir", "."))
 
-    workflow = ValidationWorkflow(project_dir)
+    workflow = get_validation_workflow(project_dir)
     result = await workflow.validate_implementation(feature_name)
 
-    return result.model_dump_json(indent=2)
+    return result
 
 
 validate_impl_tool = Tool(
     name="validate_impl",
     description="Validate implementation completeness against task breakdown",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "feature_name": {"type": "string", "description": "Name of the feature"},
-            "project_dir": {
-                "type": "string",
-                "description": "Project directory (defaults to current directory)",
-            },
-        },
-        "required": ["feature_name"],
-    },
+    inputSchema=feature_schema(),
 )
 
-register_tool(validate_impl_tool, validate_impl_handler)
+
+def register() -> None:
+    """Register the validation tools with the tool registry."""
+    register_tools(
+        [
+            (validate_gap_tool, validate_gap_handler),
+            (validate_design_tool, validate_design_handler),
+            (validate_impl_tool, validate_impl_handler),
+        ]
+    )
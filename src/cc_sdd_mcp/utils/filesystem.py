@@ -1,17 +1,153 @@
 """File system operations for managing .kiro directory structure."""
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from cc_sdd_mcp.models.specification import SpecificationMetadata
-from cc_sdd_mcp.models.steering import SteeringDocument, SteeringFileType, SteeringStatus
+from cc_sdd_mcp.models.steering import (
+    DEFAULT_STEERING_TYPES,
+    SteeringDocument,
+    SteeringFileType,
+    SteeringStatus,
+)
 from cc_sdd_mcp.utils.paths import (
     ensure_directory_exists,
-    get_spec_dir,
+    get_specs_dir,
     get_steering_dir,
+    spec_dir_name,
 )
 
+# Steering documents keyed by path, with the (st_mtime_ns, st_size) they were read at
+_DOC_CACHE: dict[Path, tuple[tuple[int, int], SteeringDocument]] = {}
+
+# Upper bound on threads used to read uncached steering files in parallel
+_MAX_READ_WORKERS = 8
+
+
+def _cached_steering_doc(
+    file_type: SteeringFileType, file_path: Path, stat: os.stat_result
+) -> SteeringDocument | None:
+    """Return the cached document for a file if it has not changed since it was read."""
+    cached = _DOC_CACHE.get(file_path)
+    if (
+        cached is not None
+        and cached[0] == (stat.st_mtime_ns, stat.st_size)
+        and cached[1].file_type == file_type
+    ):
+        return cached[1]
+    return None
+
+
+def _read_steering_file(
+    file_type: SteeringFileType, file_path: Path, stat: os.stat_result | None = None
+) -> SteeringDocument:
+    """Read a steering file, reusing the cached document if it has not changed.
+
+    Args:
+        file_type: Type of steering document
+        file_path: Path to the steering file
+        stat: Stat result for the file, if the caller already has one
+
+    Returns:
+        SteeringDocument for the file
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    if stat is None:
+        stat = file_path.stat()
+
+    cached = _cached_steering_doc(file_type, file_path, stat)
+    if cached is not None:
+        return cached
+
+    doc = SteeringDocument(
+        file_type=file_type,
+        file_path=file_path,
+        content=file_path.read_bytes().decode("utf-8"),
+        last_modified=datetime.fromtimestamp(stat.st_mtime),
+    )
+    _DOC_CACHE[file_path] = ((stat.st_mtime_ns, stat.st_size), doc)
+    return doc
+
+
+def _write_text(file_path: Path, content: str) -> os.stat_result:
+    """Write UTF-8 text to a file and return its stat from the open handle.
+
+    Stat-ing the file descriptor saves a second path lookup after the write.
+
+    Args:
+        file_path: Path to write
+        content: Content to write
+
+    Returns:
+        Stat result of the written file
+    """
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(content)
+        f.flush()
+        return os.fstat(f.fileno())
+
+
+def _write_steering_file(
+    file_type: SteeringFileType, file_path: Path, content: str
+) -> SteeringDocument:
+    """Write a steering file and refresh its cache entry.
+
+    Args:
+        file_type: Type of steering document
+        file_path: Path to write the content to
+        content: Content to write
+
+    Returns:
+        SteeringDocument representing the written file
+    """
+    stat = _write_text(file_path, content)
+    doc = SteeringDocument(
+        file_type=file_type,
+        file_path=file_path,
+        content=content,
+        last_modified=datetime.fromtimestamp(stat.st_mtime),
+    )
+    _DOC_CACHE[file_path] = ((stat.st_mtime_ns, stat.st_size), doc)
+    return doc
+
+
+# Spec file contents keyed by path, validated the same way as _DOC_CACHE
+_TEXT_CACHE: dict[Path, tuple[tuple[int, int], str]] = {}
+
+
+def _read_text_cached(file_path: Path) -> str:
+    """Read a UTF-8 file, reusing the cached text if the file has not changed.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        File content
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    stat = file_path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _TEXT_CACHE.get(file_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    content = file_path.read_bytes().decode("utf-8")
+    _TEXT_CACHE[file_path] = (key, content)
+    return content
+
+
+def clear_file_cache() -> None:
+    """Drop all cached file contents (useful for testing)."""
+    _DOC_CACHE.clear()
+    _TEXT_CACHE.clear()
+
 
 class FileSystemManager:
     """Manages file system operations for cc-sdd."""
@@ -24,10 +160,19 @@ class FileSystemManager:
         """
         self.project_root = project_root
         self.steering_dir = get_steering_dir(project_root)
+        self.specs_dir = get_specs_dir(project_root)
+        # Directories this manager has already created or found to exist
+        self._ensured_dirs: set[Path] = set()
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create a directory once per manager, skipping mkdir on repeat writes."""
+        if directory not in self._ensured_dirs:
+            ensure_directory_exists(directory)
+            self._ensured_dirs.add(directory)
 
     def ensure_steering_exists(self) -> None:
         """Ensure the steering directory exists."""
-        ensure_directory_exists(self.steering_dir)
+        self._ensure_dir(self.steering_dir)
 
     def read_steering_document(self, file_type: SteeringFileType) -> SteeringDocument | None:
         """Read a steering document.
@@ -41,20 +186,11 @@ class FileSystemManager:
         filename = f"{file_type.value}.md"
         file_path = self.steering_dir / filename
 
-        if not file_path.exists():
+        try:
+            return _read_steering_file(file_type, file_path)
+        except FileNotFoundError:
             return None
 
-        content = file_path.read_text(encoding="utf-8")
-        stat = file_path.stat()
-        last_modified = datetime.fromtimestamp(stat.st_mtime)
-
-        return SteeringDocument(
-            file_type=file_type,
-            file_path=file_path,
-            content=content,
-            last_modified=last_modified,
-        )
-
     def write_steering_document(
         self, file_type: SteeringFileType, content: str
     ) -> SteeringDocument:
@@ -72,17 +208,27 @@ class FileSystemManager:
         filename = f"{file_type.value}.md"
         file_path = self.steering_dir / filename
 
-        file_path.write_text(content, encoding="utf-8")
+        return _write_steering_file(file_type, file_path, content)
 
-        stat = file_path.stat()
-        last_modified = datetime.fromtimestamp(stat.st_mtime)
+    def write_steering_documents(
+        self, items: list[tuple[SteeringFileType, str]]
+    ) -> list[SteeringDocument]:
+        """Write several steering documents, creating the directory only once.
 
-        return SteeringDocument(
-            file_type=file_type,
-            file_path=file_path,
-            content=content,
-            last_modified=last_modified,
-        )
+        Args:
+            items: (file type, content) pairs to write
+
+        Returns:
+            SteeringDocument objects for the written files, in input order
+        """
+        self.ensure_steering_exists()
+
+        documents = []
+        for file_type, content in items:
+            file_path = self.steering_dir / f"{file_type.value}.md"
+            documents.append(_write_steering_file(file_type, file_path, content))
+
+        return documents
 
     def list_steering_documents(self) -> list[SteeringDocument]:
         """List all steering documents.
@@ -90,32 +236,55 @@ class FileSystemManager:
         Returns:
             List of SteeringDocument objects
         """
-        if not self.steering_dir.exists():
-            return []
+        return self._scan_steering()[1]
 
-        documents = []
-        for file_path in self.steering_dir.glob("*.md"):
-            # Determine file type from filename
-            stem = file_path.stem
-            try:
-                file_type = SteeringFileType(stem)
-            except ValueError:
-                file_type = SteeringFileType.CUSTOM
-
-            content = file_path.read_text(encoding="utf-8")
-            stat = file_path.stat()
-            last_modified = datetime.fromtimestamp(stat.st_mtime)
-
-            documents.append(
-                SteeringDocument(
-                    file_type=file_type,
-                    file_path=file_path,
-                    content=content,
-                    last_modified=last_modified,
-                )
-            )
+    def _scan_steering(self) -> tuple[bool, list[SteeringDocument]]:
+        """Scan the steering directory once.
 
-        return documents
+        Returns:
+            Whether the steering directory exists, and the documents in it
+        """
+        try:
+            entries = os.scandir(self.steering_dir)
+        except FileNotFoundError:
+            return False, []
+
+        documents: list[SteeringDocument | None] = []
+        # Slots in documents still to be filled, with the arguments to read them
+        pending_slots: list[int] = []
+        pending: list[tuple[SteeringFileType, Path, os.stat_result]] = []
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".md") or not entry.is_file():
+                    continue
+
+                # Determine file type from filename
+                stem = name[:-3]
+                try:
+                    file_type = SteeringFileType(stem)
+                except ValueError:
+                    file_type = SteeringFileType.CUSTOM
+
+                file_path = self.steering_dir / name
+                stat = entry.stat()
+                doc = _cached_steering_doc(file_type, file_path, stat)
+                if doc is None:
+                    pending_slots.append(len(documents))
+                    pending.append((file_type, file_path, stat))
+                documents.append(doc)
+
+        # Read changed files in parallel; on slow (network) filesystems the
+        # reads are dominated by I/O wait, during which the GIL is released
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(pending), _MAX_READ_WORKERS)) as pool:
+                loaded = list(pool.map(lambda args: _read_steering_file(*args), pending))
+        else:
+            loaded = [_read_steering_file(*args) for args in pending]
+        for slot, doc in zip(pending_slots, loaded, strict=True):
+            documents[slot] = doc
+
+        return True, documents
 
     def get_steering_status(self) -> SteeringStatus:
         """Get status of steering documents.
@@ -123,21 +292,13 @@ class FileSystemManager:
         Returns:
             SteeringStatus object with current state
         """
-        # Check if steering directory exists
-        exists = self.steering_dir.exists()
-
-        # List existing documents
-        documents = self.list_steering_documents()
+        # One scan tells both whether the directory exists and what is in it
+        exists, documents = self._scan_steering()
 
         # Find missing defaults
-        default_types = [
-            SteeringFileType.PRODUCT,
-            SteeringFileType.TECH,
-            SteeringFileType.STRUCTURE,
-        ]
         existing_types = {doc.file_type for doc in documents}
         missing_defaults = [
-            file_type for file_type in default_types if file_type not in existing_types
+            file_type for file_type in DEFAULT_STEERING_TYPES if file_type not in existing_types
         ]
 
         # Get most recent modification time
@@ -162,8 +323,8 @@ class FileSystemManager:
         Returns:
             Path to the spec directory
         """
-        spec_dir = get_spec_dir(feature_name, self.project_root)
-        ensure_directory_exists(spec_dir)
+        spec_dir = self.specs_dir / spec_dir_name(feature_name)
+        self._ensure_dir(spec_dir)
         return spec_dir
 
     def write_spec_metadata(self, feature_name: str, metadata: SpecificationMetadata) -> None:
@@ -176,7 +337,7 @@ class FileSystemManager:
         spec_dir = self.ensure_spec_dir_exists(feature_name)
         spec_file = spec_dir / "spec.json"
 
-        spec_file.write_text(metadata.model_dump_json(indent=2), encoding="utf-8")
+        spec_file.write_bytes(metadata.to_json_bytes())
 
     def read_spec_metadata(self, feature_name: str) -> SpecificationMetadata | None:
         """Read specification metadata from spec.json.
@@ -187,14 +348,15 @@ class FileSystemManager:
         Returns:
             SpecificationMetadata if file exists, None otherwise
         """
-        spec_dir = get_spec_dir(feature_name, self.project_root)
+        spec_dir = self.specs_dir / spec_dir_name(feature_name)
         spec_file = spec_dir / "spec.json"
 
-        if not spec_file.exists():
+        try:
+            data = spec_file.read_bytes()
+        except FileNotFoundError:
             return None
 
-        data = json.loads(spec_file.read_text(encoding="utf-8"))
-        return SpecificationMetadata(**data)
+        return SpecificationMetadata.model_validate_json(data)
 
     def write_spec_file(self, feature_name: str, filename: str, content: str) -> None:
         """Write a file in the spec directory.
@@ -206,7 +368,8 @@ class FileSystemManager:
         """
         spec_dir = self.ensure_spec_dir_exists(feature_name)
         file_path = spec_dir / filename
-        file_path.write_text(content, encoding="utf-8")
+        stat = _write_text(file_path, content)
+        _TEXT_CACHE[file_path] = ((stat.st_mtime_ns, stat.st_size), content)
 
     def read_spec_file(self, feature_name: str, filename: str) -> str | None:
         """Read a file from the spec directory.
@@ -218,14 +381,14 @@ class FileSystemManager:
         Returns:
             File content if exists, None otherwise
         """
-        spec_dir = get_spec_dir(feature_name, self.project_root)
+        spec_dir = self.specs_dir / spec_dir_name(feature_name)
         file_path = spec_dir / filename
 
-        if not file_path.exists():
+        try:
+            return _read_text_cached(file_path)
+        except FileNotFoundError:
             return None
 
-        return file_path.read_text(encoding="utf-8")
-
     def spec_file_exists(self, feature_name: str, filename: str) -> bool:
         """Check if a spec file exists.
 
@@ -236,7 +399,7 @@ class FileSystemManager:
         Returns:
             True if file exists, False otherwise
         """
-        spec_dir = get_spec_dir(feature_name, self.project_root)
+        spec_dir = self.specs_dir / spec_dir_name(feature_name)
         return (spec_dir / filename).exists()
 
     def list_specs(self) -> list[str]:
@@ -245,10 +408,14 @@ class FileSystemManager:
         Returns:
             List of feature names
         """
-        from cc_sdd_mcp.utils.paths import get_specs_dir
-
-        specs_dir = get_specs_dir(self.project_root)
-        if not specs_dir.exists():
+        try:
+            entries = os.scandir(self.specs_dir)
+        except FileNotFoundError:
             return []
 
-        return [d.name for d in specs_dir.iterdir() if d.is_dir() and (d / "spec.json").exists()]
+        with entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "spec.json"))
+            ]
@@ -1,7 +1,20 @@
 """Utilities for path resolution and project discovery."""
 
+import functools
+import os
 from pathlib import Path
 
+# Indicators of a project root
+_PROJECT_INDICATORS = (
+    ".git",
+    ".kiro",
+    "pyproject.toml",
+    "package.json",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+)
+
 
 def find_project_root(start_path: Path | None = None) -> Path | None:
     """Find the project root directory.
@@ -11,6 +24,9 @@ def find_project_root(start_path: Path | None = None) -> Path | None:
     - .kiro directory
     - pyproject.toml, package.json, etc.
 
+    Results are cached per resolved start path. Call clear_project_root_cache()
+    after creating a project indicator outside ensure_directory_exists().
+
     Args:
         start_path: Path to start searching from (defaults to current directory)
 
@@ -20,29 +36,29 @@ def find_project_root(start_path: Path | None = None) -> Path | None:
     if start_path is None:
         start_path = Path.cwd()
 
-    current = start_path.resolve()
+    return _find_project_root(start_path.resolve())
+
 
-    # Indicators of a project root
-    indicators = [
-        ".git",
-        ".kiro",
-        "pyproject.toml",
-        "package.json",
-        "Cargo.toml",
-        "go.mod",
-        "pom.xml",
-    ]
+@functools.lru_cache(maxsize=64)
+def _find_project_root(start: Path) -> Path | None:
+    current = start
 
     # Search upward until we find a project root or hit filesystem root
     while current != current.parent:
-        for indicator in indicators:
-            if (current / indicator).exists():
+        base = os.fspath(current)
+        for indicator in _PROJECT_INDICATORS:
+            if os.path.exists(os.path.join(base, indicator)):
                 return current
         current = current.parent
 
     return None
 
 
+def clear_project_root_cache() -> None:
+    """Drop memoized project roots (useful for testing)."""
+    _find_project_root.cache_clear()
+
+
 def get_kiro_dir(project_root: Path | None = None) -> Path:
     """Get the .kiro directory path.
 
@@ -102,9 +118,19 @@ def get_spec_dir(feature_name: str, project_root: Path | None = None) -> Path:
         Path to .kiro/specs/{feature_name} directory
     """
     specs_dir = get_specs_dir(project_root)
-    # Sanitize feature name
-    safe_feature_name = feature_name.lower().replace(" ", "-")
-    return specs_dir / safe_feature_name
+    return specs_dir / spec_dir_name(feature_name)
+
+
+def spec_dir_name(feature_name: str) -> str:
+    """Get the directory name used for a feature's spec.
+
+    Args:
+        feature_name: Name of the feature
+
+    Returns:
+        Sanitized directory name (lowercase, hyphens instead of spaces)
+    """
+    return feature_name.lower().replace(" ", "-")
 
 
 def ensure_directory_exists(directory: Path) -> None:
@@ -114,6 +140,28 @@ def ensure_directory_exists(directory: Path) -> None:
         directory: Path to directory
     """
     directory.mkdir(parents=True, exist_ok=True)
+    # The new directory may be a .kiro that changes the project root below it
+    clear_project_root_cache()
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_in(cwd: str, project_dir: str) -> Path:
+    return (Path(cwd) / project_dir).resolve()
+
+
+def resolve_project_dir(project_dir: str = ".") -> Path:
+    """Resolve a project directory argument to an absolute path.
+
+    Results are cached per working directory, so repeated tool calls for the
+    same project skip the symlink resolution syscalls.
+
+    Args:
+        project_dir: Project directory string, absolute or relative to the cwd
+
+    Returns:
+        Resolved Path object
+    """
+    return _resolve_in(os.getcwd(), project_dir)
 
 
 def get_project_path_from_args(project_path: str | None = None) -> Path:
@@ -126,7 +174,7 @@ def get_project_path_from_args(project_path: str | None = None) -> Path:
         Resolved Path object
     """
     if project_path:
-        return Path(project_path).resolve()
+        return resolve_project_dir(project_path)
 
     # Try to find project root
     root = find_project_root()
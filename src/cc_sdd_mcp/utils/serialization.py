@@ -0,0 +1,43 @@
+"""JSON encoding helpers for tool responses."""
+
+import json
+import os
+from datetime import date
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (the "speedups" extra)
+    orjson = None  # type: ignore[assignment]
+
+# Responses are read by MCP clients, so they are compact unless
+# CC_SDD_PRETTY_JSON is set for debugging
+PRETTY_JSON = bool(os.environ.get("CC_SDD_PRETTY_JSON"))
+
+
+def _default(obj: Any) -> str:
+    """Encode values the JSON encoders don't handle natively."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(obj: Any, *, indent: bool = PRETTY_JSON) -> str:
+    """Encode an object as JSON text.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise. Both produce ISO 8601 datetimes; other values neither encoder
+    understands (such as ``Path``) are converted with ``str``.
+
+    Args:
+        obj: Object to encode
+        indent: Indent the output by two spaces (defaults to ``PRETTY_JSON``)
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        # Accept non-str dict keys like the json module does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_default, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=_default)
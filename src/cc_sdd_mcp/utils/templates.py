@@ -1,6 +1,10 @@
 """Template discovery and loading utilities with Jinja2 support."""
 
+import functools
+import os
+import re
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader, Template
@@ -39,6 +43,72 @@ def _find_templates_dir() -> Path:
 TEMPLATES_DIR = _find_templates_dir()
 
 
+def _walk_md(directory: str) -> Iterator[str]:
+    """Yield paths of .md entries under directory, in Path.rglob("*.md") order.
+
+    Each directory's matches come before its subdirectories', and symlinked
+    directories are not descended into. DirEntry type checks reuse the d_type
+    from readdir instead of issuing a stat per entry.
+    """
+    with os.scandir(directory) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.name.endswith(".md"):
+            yield entry.path
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_md(entry.path)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_template_path(
+    templates_dir: Path, category: str, filename: str, language: str
+) -> Path | None:
+    """Resolve a template file, trying the language, English, then no suffix.
+
+    Results are memoized: the templates directory is package data and does not
+    change while the server runs. Call clear_template_cache() after editing it.
+
+    Args:
+        templates_dir: Root templates directory
+        category: Template category (settings, agents, etc.)
+        filename: Template filename
+        language: Preferred language code
+
+    Returns:
+        Path to template file if it exists, None otherwise
+    """
+    # Probe with plain strings; only a hit is turned into a Path
+    category_dir = os.path.join(os.fspath(templates_dir), category)
+    for candidate in (f"{filename}.{language}.md", f"{filename}.en.md", f"{filename}.md"):
+        path = os.path.join(category_dir, candidate)
+        if os.path.isfile(path):
+            return Path(path)
+    return None
+
+
+@functools.lru_cache(maxsize=128)
+def _read_template(template_path: Path) -> str:
+    """Read a resolved template file once; later loads are served from memory."""
+    return template_path.read_bytes().decode("utf-8")
+
+
+def clear_template_cache() -> None:
+    """Drop memoized template paths and contents (useful for testing)."""
+    _resolve_template_path.cache_clear()
+    _read_template.cache_clear()
+
+
+# {{VARIABLE}} placeholders for substitute_variables
+_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]*)\}\}")
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_template(template_content: str) -> Template:
+    """Compile a template string once; repeated renders reuse the compiled code."""
+    return Template(template_content)
+
+
 class TemplateLoader:
     """Loads and renders templates for steering and specification documents.
 
@@ -74,22 +144,7 @@ class TemplateLoader:
         Returns:
             Path to template file if it exists, None otherwise
         """
-        # Try language-specific template first
-        lang_path = self.templates_dir / category / f"{filename}.{self.language}.md"
-        if lang_path.exists():
-            return lang_path
-
-        # Fall back to English
-        en_path = self.templates_dir / category / f"{filename}.en.md"
-        if en_path.exists():
-            return en_path
-
-        # Try without language suffix
-        default_path = self.templates_dir / category / f"{filename}.md"
-        if default_path.exists():
-            return default_path
-
-        return None
+        return _resolve_template_path(self.templates_dir, category, filename, self.language)
 
     def load_steering_template(self, template_name: str) -> str | None:
         """Load a steering template.
@@ -103,8 +158,8 @@ class TemplateLoader:
         # Steering templates are in settings directory
         template_path = self._get_template_path("settings/steering", template_name)
 
-        if template_path and template_path.exists():
-            return template_path.read_text(encoding="utf-8")
+        if template_path:
+            return _read_template(template_path)
 
         # Fall back to default template
         return self._get_default_steering_template(template_name)
@@ -122,8 +177,8 @@ class TemplateLoader:
         # For enhanced templates, use spec_type as the filename in shared/settings/templates/specs
         template_path = self._get_template_path("shared/settings/templates/specs", spec_type)
 
-        if template_path and template_path.exists():
-            return template_path.read_text(encoding="utf-8")
+        if template_path:
+            return _read_template(template_path)
 
         return self._get_default_spec_template(spec_type)
 
@@ -265,11 +320,8 @@ Total: X hours
         Returns:
             Template with variables substituted
         """
-        result = template
-        for key, value in variables.items():
-            placeholder = f"{{{{{key}}}}}"
-            result = result.replace(placeholder, value)
-        return result
+        # One pass over the template; unknown placeholders are left as they are
+        return _PLACEHOLDER_RE.sub(lambda m: variables.get(m.group(1), m.group(0)), template)
 
     def render_jinja_template(self, template_content: str, context: dict) -> str:
         """Render a template string using Jinja2.
@@ -281,7 +333,7 @@ Total: X hours
         Returns:
             Rendered template content
         """
-        template = Template(template_content)
+        template = _compile_template(template_content)
         return template.render(**context)
 
     def render_jinja_file(self, template_path: str | Path, context: dict) -> str:
@@ -319,17 +371,22 @@ Total: X hours
         if category:
             search_dir = search_dir / category
 
-        if search_dir.exists():
-            for template_file in search_dir.rglob("*.md"):
-                rel_path = template_file.relative_to(self.templates_dir)
-                templates.append(
-                    {
-                        "name": template_file.stem,
-                        "path": str(rel_path),
-                        "category": str(rel_path.parent),
-                        "language": self._extract_language(template_file.name),
-                    }
-                )
+        if not search_dir.is_dir():
+            return templates
+
+        # Slice paths relative to the templates directory as strings
+        prefix_len = len(os.path.join(os.fspath(self.templates_dir), ""))
+        for template_path in _walk_md(os.fspath(search_dir)):
+            rel_path = template_path[prefix_len:]
+            filename = os.path.basename(rel_path)
+            templates.append(
+                {
+                    "name": os.path.splitext(filename)[0],
+                    "path": rel_path,
+                    "category": os.path.dirname(rel_path) or ".",
+                    "language": self._extract_language(filename),
+                }
+            )
 
         return templates
 
@@ -346,3 +403,24 @@ Total: X hours
         if len(parts) >= 3:  # name.lang.md
             return parts[-2]
         return "default"
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_loader(project_dir: str, language: str) -> TemplateLoader:
+    return TemplateLoader(project_dir=Path(project_dir), language=language)
+
+
+def get_template_loader(project_dir: Path = Path("."), language: str = "en") -> TemplateLoader:
+    """Get a shared template loader for a project directory and language.
+
+    Loaders are cached per resolved project directory, so the Jinja2
+    environment is built once and reused across tool calls.
+
+    Args:
+        project_dir: Project directory for loading custom templates
+        language: Language code for templates (en, ja, zh-TW, etc.)
+
+    Returns:
+        Cached TemplateLoader instance
+    """
+    return _cached_loader(str(project_dir.resolve()), language)
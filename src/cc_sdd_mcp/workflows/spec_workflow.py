@@ -1,12 +1,17 @@
 """Workflow logic for specification lifecycle management."""
 
-import json
+import asyncio
+import functools
 import logging
-from datetime import datetime
+import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from cc_sdd_mcp.models import clock
+from cc_sdd_mcp.models.clock import frozen_now
 from cc_sdd_mcp.models.specification import (
+    PHASE_INITIALIZED,
     DesignDocument,
     RequirementsDocument,
     SpecificationMetadata,
@@ -16,11 +21,52 @@ from cc_sdd_mcp.models.specification import (
 )
 from cc_sdd_mcp.models.steering import SteeringConfig
 from cc_sdd_mcp.utils.filesystem import FileSystemManager
-from cc_sdd_mcp.utils.templates import TemplateLoader
+from cc_sdd_mcp.utils.templates import TemplateLoader, get_template_loader
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_metadata(path: str, mtime_ns: int, size: int) -> SpecificationMetadata:
+    """Parse a metadata file once per (mtime, size) version of it."""
+    return SpecificationMetadata.model_validate_json(Path(path).read_bytes())
+
+
+def write_metadata_file(metadata_file: Path, metadata: SpecificationMetadata) -> None:
+    """Write a spec's metadata.json and drop cached parses of earlier versions.
+
+    Every metadata write goes through here: a rewrite within one timestamp tick
+    can keep mtime and size unchanged, which _parse_metadata's key cannot tell apart.
+
+    Args:
+        metadata_file: Path to metadata.json
+        metadata: Metadata to write
+    """
+    metadata_file.write_bytes(metadata.to_json_bytes())
+    _parse_metadata.cache_clear()
+
+
+def _write_text_if_changed(path: Path, content: str) -> None:
+    """Write content to path as UTF-8 unless the file already holds exactly that text.
+
+    Regenerating a document with unchanged inputs then leaves the file untouched.
+    The existing file is only read when its size matches, and is compared as
+    bytes, so hand-edited or non-UTF-8 files are simply overwritten.
+
+    Args:
+        path: File to write
+        content: Content to write
+    """
+    data = content.encode("utf-8")
+    try:
+        if os.stat(path).st_size == len(data) and path.read_bytes() == data:
+            logger.debug(f"{path.name} is unchanged, skipping write")
+            return
+    except OSError:
+        pass
+    path.write_bytes(data)
+
+
 class SpecWorkflow:
     """Manages the specification lifecycle workflow."""
 
@@ -31,9 +77,24 @@ class SpecWorkflow:
             project_dir: Project directory path
         """
         self.project_dir = project_dir
-        self.fs_manager = FileSystemManager(project_dir)
-        self.template_loader = TemplateLoader(project_dir)
-        self.config = SteeringConfig()
+
+    # Collaborators are built on first use, so calls that need only some of
+    # them (such as get_spec_status) skip constructing the rest
+
+    @functools.cached_property
+    def fs_manager(self) -> FileSystemManager:
+        """File system manager for the project."""
+        return FileSystemManager(self.project_dir)
+
+    @functools.cached_property
+    def template_loader(self) -> TemplateLoader:
+        """Shared template loader for the project."""
+        return get_template_loader(self.project_dir)
+
+    @functools.cached_property
+    def config(self) -> SteeringConfig:
+        """Steering configuration."""
+        return SteeringConfig()
 
     def _get_spec_dir(self, feature_name: str) -> Path:
         """Get the spec directory for a feature.
@@ -44,7 +105,12 @@ class SpecWorkflow:
         Returns:
             Path to spec directory
         """
-        return self.project_dir / self.config.kiro_dir / "specs" / feature_name
+        return self._specs_dir / feature_name
+
+    @functools.cached_property
+    def _specs_dir(self) -> Path:
+        """Specs root, joined once rather than on every _get_spec_dir call."""
+        return self.project_dir / self.config.kiro_dir / "specs"
 
     def _load_metadata(self, feature_name: str) -> SpecificationMetadata:
         """Load specification metadata.
@@ -61,15 +127,18 @@ class SpecWorkflow:
         spec_dir = self._get_spec_dir(feature_name)
         metadata_file = spec_dir / "metadata.json"
 
-        if not metadata_file.exists():
+        try:
+            stat = os.stat(metadata_file)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Specification '{feature_name}' not found. Run spec_init first."
-            )
+            ) from None
 
-        metadata_data = json.loads(metadata_file.read_text())
-        return SpecificationMetadata(**metadata_data)
+        metadata = _parse_metadata(os.fspath(metadata_file), stat.st_mtime_ns, stat.st_size)
+        # Callers update the metadata in place, so hand out a copy of the cached object
+        return metadata.model_copy(update={"approved_phases": list(metadata.approved_phases)})
 
-    def _save_metadata(self, metadata: SpecificationMetadata) -> None:
+    async def _save_metadata(self, metadata: SpecificationMetadata) -> None:
         """Save specification metadata.
 
         Args:
@@ -79,11 +148,101 @@ class SpecWorkflow:
         metadata_file = spec_dir / "metadata.json"
 
         # Update timestamp
-        metadata.updated_at = datetime.now()
+        metadata.updated_at = clock.now()
 
-        metadata_file.write_text(metadata.model_dump_json(indent=2))
+        await asyncio.to_thread(write_metadata_file, metadata_file, metadata)
         logger.info(f"Updated metadata for {metadata.feature_name}")
 
+    async def _generate_phase_document(
+        self,
+        feature_name: str,
+        auto_approve: bool,
+        phase: SpecPhase,
+        previous_phase: SpecPhase,
+        build_context: Callable[[SpecificationMetadata], dict[str, Any]],
+        message: str,
+    ) -> dict[str, Any]:
+        """Render and save the document for a phase, then advance the spec to it.
+
+        The phase's value names its template, its output file (``<phase>.md``) and
+        the ``<phase>_file`` key of the result.
+
+        Args:
+            feature_name: Feature name
+            auto_approve: Auto-approve and move to next phase
+            phase: Phase whose document is generated
+            previous_phase: Phase the spec must be in (or have approved) first
+            build_context: Builds the template context from the metadata
+            message: Success message for the result
+
+        Returns:
+            Result dictionary with generation status
+        """
+        name = phase.value
+
+        # Load metadata
+        metadata = self._load_metadata(feature_name)
+
+        # Check current phase
+        if metadata.current_phase not in (previous_phase, phase):
+            return {
+                "success": False,
+                "error": f"Cannot generate {name} in phase: {metadata.current_phase.value}",
+                "current_phase": metadata.current_phase.value,
+            }
+
+        # Check if the previous phase is approved
+        if (
+            previous_phase != PHASE_INITIALIZED
+            and previous_phase not in metadata.approved_phases
+            and metadata.current_phase == previous_phase
+            and not auto_approve
+        ):
+            return {
+                "success": False,
+                "error": f"{previous_phase.value.capitalize()} must be approved before generating {name}",
+                "current_phase": metadata.current_phase.value,
+                "message": f"Please review and approve {previous_phase.value} first, or use auto_approve=true",
+            }
+
+        # Load the phase template
+        template = self.template_loader.load_spec_template(name, name)
+        if not template:
+            return {"success": False, "error": f"{name.capitalize()} template not found"}
+
+        # One timestamp for the rendered document and the metadata update
+        with frozen_now():
+            # Build context and render template
+            context = build_context(metadata)
+            try:
+                content = self.template_loader.render_jinja_template(template, context)
+            except Exception as e:
+                logger.error(f"Failed to render {name} template: {e}")
+                return {"success": False, "error": f"Template rendering failed: {str(e)}"}
+
+            # Save the document
+            spec_dir = self._get_spec_dir(feature_name)
+            document_file = spec_dir / f"{name}.md"
+            await asyncio.to_thread(_write_text_if_changed, document_file, content)
+
+            # Update metadata, saving (and bumping updated_at) only if it changed
+            dirty = metadata.current_phase != phase
+            metadata.current_phase = phase
+            if auto_approve and phase not in metadata.approved_phases:
+                metadata.approved_phases.append(phase)
+                dirty = True
+            if dirty:
+                await self._save_metadata(metadata)
+
+        return {
+            "success": True,
+            "feature_name": feature_name,
+            f"{name}_file": str(document_file),
+            "current_phase": metadata.current_phase.value,
+            "auto_approved": auto_approve,
+            "message": message,
+        }
+
     def _build_requirements_context(self, metadata: SpecificationMetadata) -> dict[str, Any]:
         """Build context for requirements template rendering.
         
@@ -93,7 +252,7 @@ class SpecWorkflow:
         Returns:
             Context dictionary for template rendering
         """
-        now = datetime.now()
+        now = clock.now()
         return {
             # Metadata
             "VERSION": "1.0.0",
@@ -169,55 +328,14 @@ class SpecWorkflow:
         Returns:
             Result dictionary with generation status
         """
-        # Load metadata
-        metadata = self._load_metadata(feature_name)
-
-        # Check current phase
-        if metadata.current_phase not in [SpecPhase.INITIALIZED, SpecPhase.REQUIREMENTS]:
-            return {
-                "success": False,
-                "error": f"Cannot generate requirements in phase: {metadata.current_phase.value}",
-                "current_phase": metadata.current_phase.value,
-            }
-
-        # Load steering context
-        steering_status = self.fs_manager.get_steering_status()
-        steering_context = []
-        for doc in steering_status.documents:
-            steering_context.append(f"# {doc.file_type.value}\n{doc.content}")
-
-        # Generate requirements using enhanced template
-        template = self.template_loader.load_spec_template("requirements", "requirements")
-        if not template:
-            return {"success": False, "error": "Requirements template not found"}
-
-        # Build context and render template
-        context = self._build_requirements_context(metadata)
-        try:
-            content = self.template_loader.render_jinja_template(template, context)
-        except Exception as e:
-            logger.error(f"Failed to render requirements template: {e}")
-            return {"success": False, "error": f"Template rendering failed: {str(e)}"}
-
-        # Save requirements
-        spec_dir = self._get_spec_dir(feature_name)
-        requirements_file = spec_dir / "requirements.md"
-        requirements_file.write_text(content)
-
-        # Update metadata
-        metadata.current_phase = SpecPhase.REQUIREMENTS
-        if auto_approve and SpecPhase.REQUIREMENTS not in metadata.approved_phases:
-            metadata.approved_phases.append(SpecPhase.REQUIREMENTS)
-        self._save_metadata(metadata)
-
-        return {
-            "success": True,
-            "feature_name": feature_name,
-            "requirements_file": str(requirements_file),
-            "current_phase": metadata.current_phase.value,
-            "auto_approved": auto_approve,
-            "message": "Requirements generated successfully using enhanced EARS template",
-        }
+        return await self._generate_phase_document(
+            feature_name,
+            auto_approve,
+            SpecPhase.REQUIREMENTS,
+            SpecPhase.INITIALIZED,
+            self._build_requirements_context,
+            "Requirements generated successfully using enhanced EARS template",
+        )
 
     def _build_design_context(self, metadata: SpecificationMetadata) -> dict[str, Any]:
         """Build context for design template rendering.
@@ -228,7 +346,7 @@ class SpecWorkflow:
         Returns:
             Context dictionary for template rendering
         """
-        now = datetime.now()
+        now = clock.now()
         return {
             # Metadata
             "VERSION": "1.0.0",
@@ -295,62 +413,14 @@ class SpecWorkflow:
         Returns:
             Result dictionary with generation status
         """
-        # Load metadata
-        metadata = self._load_metadata(feature_name)
-
-        # Check current phase
-        if metadata.current_phase not in [SpecPhase.REQUIREMENTS, SpecPhase.DESIGN]:
-            return {
-                "success": False,
-                "error": f"Cannot generate design in phase: {metadata.current_phase.value}",
-                "current_phase": metadata.current_phase.value,
-            }
-
-        # Check if requirements are approved
-        if (
-            SpecPhase.REQUIREMENTS not in metadata.approved_phases
-            and metadata.current_phase == SpecPhase.REQUIREMENTS
-            and not auto_approve
-        ):
-            return {
-                "success": False,
-                "error": "Requirements must be approved before generating design",
-                "current_phase": metadata.current_phase.value,
-                "message": "Please review and approve requirements first, or use auto_approve=true",
-            }
-
-        # Load design template
-        template = self.template_loader.load_spec_template("design", "design")
-        if not template:
-            return {"success": False, "error": "Design template not found"}
-
-        # Build context and render template
-        context = self._build_design_context(metadata)
-        try:
-            content = self.template_loader.render_jinja_template(template, context)
-        except Exception as e:
-            logger.error(f"Failed to render design template: {e}")
-            return {"success": False, "error": f"Template rendering failed: {str(e)}"}
-
-        # Save design
-        spec_dir = self._get_spec_dir(feature_name)
-        design_file = spec_dir / "design.md"
-        design_file.write_text(content)
-
-        # Update metadata
-        metadata.current_phase = SpecPhase.DESIGN
-        if auto_approve and SpecPhase.DESIGN not in metadata.approved_phases:
-            metadata.approved_phases.append(SpecPhase.DESIGN)
-        self._save_metadata(metadata)
-
-        return {
-            "success": True,
-            "feature_name": feature_name,
-            "design_file": str(design_file),
-            "current_phase": metadata.current_phase.value,
-            "auto_approved": auto_approve,
-            "message": "Design generated successfully using enhanced template",
-        }
+        return await self._generate_phase_document(
+            feature_name,
+            auto_approve,
+            SpecPhase.DESIGN,
+            SpecPhase.REQUIREMENTS,
+            self._build_design_context,
+            "Design generated successfully using enhanced template",
+        )
 
     def _build_tasks_context(self, metadata: SpecificationMetadata) -> dict[str, Any]:
         """Build context for tasks template rendering.
@@ -361,7 +431,7 @@ class SpecWorkflow:
         Returns:
             Context dictionary for template rendering
         """
-        now = datetime.now()
+        now = clock.now()
         return {
             # Metadata
             "VERSION": "1.0.0",
@@ -444,62 +514,14 @@ class SpecWorkflow:
         Returns:
             Result dictionary with generation status
         """
-        # Load metadata
-        metadata = self._load_metadata(feature_name)
-
-        # Check current phase
-        if metadata.current_phase not in [SpecPhase.DESIGN, SpecPhase.TASKS]:
-            return {
-                "success": False,
-                "error": f"Cannot generate tasks in phase: {metadata.current_phase.value}",
-                "current_phase": metadata.current_phase.value,
-            }
-
-        # Check if design is approved
-        if (
-            SpecPhase.DESIGN not in metadata.approved_phases
-            and metadata.current_phase == SpecPhase.DESIGN
-            and not auto_approve
-        ):
-            return {
-                "success": False,
-                "error": "Design must be approved before generating tasks",
-                "current_phase": metadata.current_phase.value,
-                "message": "Please review and approve design first, or use auto_approve=true",
-            }
-
-        # Load tasks template
-        template = self.template_loader.load_spec_template("tasks", "tasks")
-        if not template:
-            return {"success": False, "error": "Tasks template not found"}
-
-        # Build context and render template
-        context = self._build_tasks_context(metadata)
-        try:
-            content = self.template_loader.render_jinja_template(template, context)
-        except Exception as e:
-            logger.error(f"Failed to render tasks template: {e}")
-            return {"success": False, "error": f"Template rendering failed: {str(e)}"}
-
-        # Save tasks
-        spec_dir = self._get_spec_dir(feature_name)
-        tasks_file = spec_dir / "tasks.md"
-        tasks_file.write_text(content)
-
-        # Update metadata
-        metadata.current_phase = SpecPhase.TASKS
-        if auto_approve and SpecPhase.TASKS not in metadata.approved_phases:
-            metadata.approved_phases.append(SpecPhase.TASKS)
-        self._save_metadata(metadata)
-
-        return {
-            "success": True,
-            "feature_name": feature_name,
-            "tasks_file": str(tasks_file),
-            "current_phase": metadata.current_phase.value,
-            "auto_approved": auto_approve,
-            "message": "Tasks generated successfully using enhanced template",
-        }
+        return await self._generate_phase_document(
+            feature_name,
+            auto_approve,
+            SpecPhase.TASKS,
+            SpecPhase.DESIGN,
+            self._build_tasks_context,
+            "Tasks generated successfully using enhanced template",
+        )
 
     async def get_spec_status(self, feature_name: str) -> dict[str, Any]:
         """Get the current status of a specification.
@@ -514,11 +536,12 @@ class SpecWorkflow:
             metadata = self._load_metadata(feature_name)
             spec_dir = self._get_spec_dir(feature_name)
 
-            # Check which files exist
+            # Check which files exist with one directory listing instead of a stat per file
+            present = set(os.listdir(spec_dir))
             files_exist = {
-                "requirements": (spec_dir / "requirements.md").exists(),
-                "design": (spec_dir / "design.md").exists(),
-                "tasks": (spec_dir / "tasks.md").exists(),
+                "requirements": "requirements.md" in present,
+                "design": "design.md" in present,
+                "tasks": "tasks.md" in present,
             }
 
             return {
@@ -533,3 +556,19 @@ class SpecWorkflow:
             }
         except FileNotFoundError as e:
             return {"error": str(e), "feature_name": feature_name}
+
+
+@functools.lru_cache(maxsize=32)
+def get_spec_workflow(project_dir: Path) -> SpecWorkflow:
+    """Get a shared spec workflow for a project directory.
+
+    Workflows hold no per-call state, so tool handlers can reuse one per
+    project instead of rebuilding it on every call.
+
+    Args:
+        project_dir: Resolved project directory path
+
+    Returns:
+        Cached SpecWorkflow instance
+    """
+    return SpecWorkflow(project_dir)
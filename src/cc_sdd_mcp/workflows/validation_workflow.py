@@ -1,6 +1,6 @@
 """Workflow logic for specification validation."""
 
-import json
+import functools
 import logging
 from pathlib import Path
 
@@ -40,11 +40,12 @@ class ValidationWorkflow:
         spec_dir = self._get_spec_dir(feature_name)
         metadata_file = spec_dir / "metadata.json"
 
-        if not metadata_file.exists():
-            raise FileNotFoundError(f"Specification '{feature_name}' not found")
+        try:
+            metadata_bytes = metadata_file.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Specification '{feature_name}' not found") from None
 
-        metadata_data = json.loads(metadata_file.read_text())
-        return SpecificationMetadata(**metadata_data)
+        return SpecificationMetadata.model_validate_json(metadata_bytes)
 
     async def validate_gap(self, feature_name: str) -> GapAnalysisResult:
         """Analyze gap between existing code and requirements.
@@ -72,8 +73,8 @@ class ValidationWorkflow:
                     )
                 ],
                 summary="Cannot perform gap analysis without requirements",
-                existing_components=[],
-                missing_components=[
+                existing_implementations=[],
+                missing_requirements=[
                     "Requirements need to be generated",
                     "No existing components analyzed",
                 ],
@@ -163,12 +164,13 @@ class ValidationWorkflow:
                 passed=False,
                 issues=issues,
                 summary="Cannot validate design without required documents",
-                requirements_alignment=[],
-                missing_design_elements=[
+                requirements_coverage=0.0,
+                missing_components=[
                     "Architecture overview",
                     "Component design",
                     "Data models",
                 ],
+                design_completeness=0.0,
             )
 
         # Perform design validation
@@ -243,7 +245,9 @@ class ValidationWorkflow:
                 passed=False,
                 issues=issues,
                 summary="Cannot validate implementation without task breakdown",
-                completed_tasks=[],
+                tasks_completed=0,
+                tasks_total=0,
+                completion_percentage=0.0,
                 incomplete_tasks=["All tasks pending"],
             )
 
@@ -292,3 +296,19 @@ class ValidationWorkflow:
             incomplete_tasks=incomplete_list,
             test_coverage=0.0,
         )
+
+
+@functools.lru_cache(maxsize=32)
+def get_validation_workflow(project_dir: Path) -> ValidationWorkflow:
+    """Get a shared validation workflow for a project directory.
+
+    Workflows hold no per-call state, so tool handlers can reuse one per
+    project instead of rebuilding it on every call.
+
+    Args:
+        project_dir: Resolved project directory path
+
+    Returns:
+        Cached ValidationWorkflow instance
+    """
+    return ValidationWorkflow(project_dir)
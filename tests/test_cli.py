@@ -1,12 +1,16 @@
 """Tests for the CLI module."""
 
+import asyncio
 import json
+import sys
+import types
 from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
 
-from cc_sdd_mcp.cli import cli
+from cc_sdd_mcp.cli import _run_coroutine, cli, main
+from cc_sdd_mcp.tools.registry import clear_registry, get_all_tools, require_args
 
 
 @pytest.fixture
@@ -18,12 +22,8 @@ def runner():
 @pytest.fixture(autouse=True)
 def setup_registry():
     """Set up the tool registry before each test."""
-    # Tools are automatically registered on import
-    # Just ensure they're imported
-    import cc_sdd_mcp.tools.specification  # noqa: F401
-    import cc_sdd_mcp.tools.steering  # noqa: F401
-    import cc_sdd_mcp.tools.templates  # noqa: F401
-    import cc_sdd_mcp.tools.validation  # noqa: F401
+    # Built-in tools are registered again on the first registry lookup
+    clear_registry()
 
     yield
 
@@ -188,17 +188,17 @@ class TestValidateConfig:
 class TestStart:
     """Tests for start command."""
 
-    @patch("cc_sdd_mcp.cli.asyncio.run")
+    @patch("cc_sdd_mcp.cli._run_coroutine")
     def test_start_default(self, mock_run, runner):
         """Test starting server with default configuration."""
-        # Mock asyncio.run to prevent actual server start
+        # Mock the coroutine runner to prevent actual server start
         mock_run.return_value = None
 
         result = runner.invoke(cli, ["start"])
         assert result.exit_code == 0
         assert mock_run.called
 
-    @patch("cc_sdd_mcp.cli.asyncio.run")
+    @patch("cc_sdd_mcp.cli._run_coroutine")
     def test_start_with_log_level(self, mock_run, runner):
         """Test starting server with custom log level."""
         mock_run.return_value = None
@@ -207,7 +207,7 @@ class TestStart:
         assert result.exit_code == 0
         assert "DEBUG" in result.output
 
-    @patch("cc_sdd_mcp.cli.asyncio.run")
+    @patch("cc_sdd_mcp.cli._run_coroutine")
     def test_start_with_config(self, mock_run, runner, tmp_path):
         """Test starting server with config file."""
         mock_run.return_value = None
@@ -220,7 +220,21 @@ class TestStart:
         assert result.exit_code == 0
         assert "test-server" in result.output
 
-    @patch("cc_sdd_mcp.cli.asyncio.run")
+    @patch("cc_sdd_mcp.cli._run_coroutine")
+    def test_start_quiet(self, mock_run, runner, monkeypatch):
+        """Test that the startup banner can be suppressed."""
+        mock_run.return_value = None
+
+        result = runner.invoke(cli, ["start", "--quiet"])
+        assert result.exit_code == 0
+        assert "Starting" not in result.output
+
+        monkeypatch.setenv("CC_SDD_QUIET", "1")
+        result = runner.invoke(cli, ["start"])
+        assert result.exit_code == 0
+        assert "Starting" not in result.output
+
+    @patch("cc_sdd_mcp.cli._run_coroutine")
     def test_default_command_is_start(self, mock_run, runner):
         """Test that running CLI without command defaults to start."""
         mock_run.return_value = None
@@ -229,6 +243,47 @@ class TestStart:
         assert result.exit_code == 0
         assert mock_run.called
 
+    @patch("cc_sdd_mcp.cli.cli")
+    @patch("cc_sdd_mcp.cli._run_coroutine")
+    def test_main_without_args_skips_click(self, mock_run, mock_cli, monkeypatch):
+        """Test that the bare entry point starts the server without Click parsing."""
+        mock_run.return_value = None
+        monkeypatch.setattr("sys.argv", ["cc-sdd-mcp"])
+
+        main()
+        assert mock_run.called
+        assert not mock_cli.called
+
+
+class TestRunCoroutine:
+    """Tests for event loop selection."""
+
+    def test_run_coroutine_with_and_without_uvloop(self, monkeypatch):
+        """Test that uvloop's loop is used when installed, asyncio's otherwise."""
+
+        async def answer():
+            return asyncio.get_running_loop()
+
+        # A None entry makes "import uvloop" raise ImportError
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        with patch("cc_sdd_mcp.cli.asyncio.Runner") as mock_runner:
+            assert isinstance(_run_coroutine(answer()), asyncio.AbstractEventLoop)
+        assert not mock_runner.called
+
+        created = []
+
+        def new_event_loop():
+            loop = asyncio.new_event_loop()
+            created.append(loop)
+            return loop
+
+        fake_uvloop = types.ModuleType("uvloop")
+        fake_uvloop.new_event_loop = new_event_loop
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+        with patch("cc_sdd_mcp.cli.asyncio.run") as mock_run:
+            assert _run_coroutine(answer()) is created[0]
+        assert not mock_run.called
+
 
 class TestHelp:
     """Tests for help functionality."""
@@ -319,3 +374,30 @@ class TestIntegration:
         assert result.exit_code == 0
         tool_details = json.loads(result.output)
         assert tool_details["name"] == tool_name
+
+
+class TestToolRegistry:
+    """Tests for the tool registry."""
+
+    def test_tools_registered_on_first_lookup(self):
+        """Test that built-in tools are registered lazily and the listing is cached."""
+        tools = get_all_tools()
+        assert "steering_init" in {tool.name for tool in tools}
+        assert get_all_tools() is tools
+
+        clear_registry()
+        reloaded = get_all_tools()
+        assert reloaded is not tools
+        assert [tool.name for tool in reloaded] == [tool.name for tool in tools]
+
+    @pytest.mark.asyncio
+    async def test_require_args(self):
+        """Test that handlers reject calls missing a required argument."""
+
+        @require_args("feature_name", "description")
+        async def handler(arguments):
+            return arguments["feature_name"]
+
+        assert await handler({"feature_name": "x", "description": "y"}) == "x"
+        with pytest.raises(ValueError, match="Both feature_name and description are required"):
+            await handler({"feature_name": "x", "description": ""})
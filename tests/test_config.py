@@ -1,6 +1,8 @@
 """Tests for configuration system."""
 
 import json
+import os
+from pathlib import Path
 
 import pytest
 
@@ -131,6 +133,40 @@ class TestServerConfig:
         config = ServerConfig.load()
         assert config.server_name == "env-path-server"
 
+    def test_load_picks_up_file_changes(self, tmp_path):
+        """Test that cached loads are invalidated when the file changes."""
+        config_file = tmp_path / "cached.json"
+        config_file.write_text(json.dumps({"server_name": "first"}))
+
+        first = ServerConfig.load(config_path=config_file)
+        first.log_level = "DEBUG"
+        again = ServerConfig.load(config_path=config_file)
+        assert again.server_name == "first"
+        assert again.log_level == "INFO"  # Mutating a result doesn't leak into the cache
+
+        config_file.write_text(json.dumps({"server_name": "second-version"}))
+        assert ServerConfig.load(config_path=config_file).server_name == "second-version"
+
+    def test_load_after_same_size_save(self, tmp_path):
+        """Test that save() invalidates the cache even when mtime and size match."""
+        config_file = tmp_path / "same-size.json"
+        ServerConfig(default_language="en").save(config_file)
+        stat = config_file.stat()
+        assert ServerConfig.load(config_path=config_file).default_language == "en"
+
+        ServerConfig(default_language="ja").save(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert config_file.stat().st_size == stat.st_size
+
+        assert ServerConfig.load(config_path=config_file).default_language == "ja"
+
+    def test_project_dir_normalized_not_resolved(self):
+        """Test that project_dir is normalized lexically but left relative."""
+        config = ServerConfig(project_dir="some//dir/./sub/../project")
+
+        assert config.project_dir == Path("some/dir/project")
+        assert not config.project_dir.is_absolute()
+
     def test_save(self, tmp_path):
         """Test saving config to file."""
         config = ServerConfig(server_name="save-test", log_level="DEBUG")
@@ -144,6 +180,27 @@ class TestServerConfig:
         assert saved_data["server_name"] == "save-test"
         assert saved_data["log_level"] == "DEBUG"
 
+    def test_save_compact(self, tmp_path):
+        """Test saving config without indentation."""
+        config = ServerConfig(server_name="compact-test")
+        config_file = tmp_path / "compact.json"
+
+        config.save(config_file, pretty=False)
+
+        raw = config_file.read_text()
+        assert "\n" not in raw
+        assert json.loads(raw)["server_name"] == "compact-test"
+
+    def test_save_writes_utf8(self, tmp_path):
+        """Test that non-ASCII values are saved as UTF-8 regardless of locale."""
+        config = ServerConfig(project_dir="プロジェクト")
+        config_file = tmp_path / "utf8.json"
+
+        config.save(config_file)
+
+        assert "プロジェクト".encode() in config_file.read_bytes()
+        assert ServerConfig.from_file(config_file).project_dir == Path("プロジェクト")
+
     def test_to_dict(self):
         """Test converting config to dictionary."""
         config = ServerConfig(server_name="dict-test", log_level="INFO")
@@ -0,0 +1,111 @@
+"""Tests for file system caching."""
+
+import os
+
+import pytest
+
+from cc_sdd_mcp.models.steering import SteeringFileType
+from cc_sdd_mcp.utils.filesystem import FileSystemManager, clear_file_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_file_cache():
+    """Start and finish each test with empty file caches."""
+    clear_file_cache()
+    yield
+    clear_file_cache()
+
+
+def _rewrite_keeping_stat(path, content):
+    """Overwrite a file with same-size content and restore its mtime."""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+
+
+def _touch_later(path):
+    """Move a file's mtime one second forward."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestSteeringDocumentCache:
+    """Test caching of steering document reads."""
+
+    def test_second_read_is_cached(self, tmp_path):
+        """Test that an unchanged file is served from the cache."""
+        fs = FileSystemManager(tmp_path)
+        fs.ensure_steering_exists()
+        path = fs.steering_dir / "product.md"
+        path.write_text("# Product A")
+
+        first = fs.read_steering_document(SteeringFileType.PRODUCT)
+        assert fs.read_steering_document(SteeringFileType.PRODUCT) is first
+
+        _rewrite_keeping_stat(path, "# Product B")
+        assert fs.read_steering_document(SteeringFileType.PRODUCT).content == "# Product A"
+
+    def test_external_edit_is_picked_up(self, tmp_path):
+        """Test that a file with a new mtime is read again."""
+        fs = FileSystemManager(tmp_path)
+        fs.ensure_steering_exists()
+        path = fs.steering_dir / "tech.md"
+        path.write_text("# Tech A")
+        assert fs.read_steering_document(SteeringFileType.TECH).content == "# Tech A"
+
+        path.write_text("# Tech B")
+        _touch_later(path)
+        assert fs.read_steering_document(SteeringFileType.TECH).content == "# Tech B"
+
+    def test_write_refreshes_entry(self, tmp_path):
+        """Test that write_steering_document replaces the cached document."""
+        fs = FileSystemManager(tmp_path)
+        fs.write_steering_document(SteeringFileType.STRUCTURE, "# Layout A")
+        path = fs.steering_dir / "structure.md"
+        stat = path.stat()
+        fs.read_steering_document(SteeringFileType.STRUCTURE)
+
+        fs.write_steering_document(SteeringFileType.STRUCTURE, "# Layout B")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert fs.read_steering_document(SteeringFileType.STRUCTURE).content == "# Layout B"
+
+
+class TestSpecFileCache:
+    """Test caching of spec file reads."""
+
+    def test_second_read_is_cached(self, tmp_path):
+        """Test that an unchanged file is served from the cache."""
+        fs = FileSystemManager(tmp_path)
+        path = fs.ensure_spec_dir_exists("cached-feature") / "requirements.md"
+        path.write_text("# Requirements A")
+
+        assert fs.read_spec_file("cached-feature", "requirements.md") == "# Requirements A"
+
+        _rewrite_keeping_stat(path, "# Requirements B")
+        assert fs.read_spec_file("cached-feature", "requirements.md") == "# Requirements A"
+
+    def test_external_edit_is_picked_up(self, tmp_path):
+        """Test that a file with a new mtime is read again."""
+        fs = FileSystemManager(tmp_path)
+        path = fs.ensure_spec_dir_exists("edited-feature") / "design.md"
+        path.write_text("# Design A")
+        assert fs.read_spec_file("edited-feature", "design.md") == "# Design A"
+
+        path.write_text("# Design B")
+        _touch_later(path)
+        assert fs.read_spec_file("edited-feature", "design.md") == "# Design B"
+
+    def test_write_refreshes_entry(self, tmp_path):
+        """Test that write_spec_file replaces the cached content."""
+        fs = FileSystemManager(tmp_path)
+        fs.write_spec_file("written-feature", "tasks.md", "# Tasks A")
+        path = fs.ensure_spec_dir_exists("written-feature") / "tasks.md"
+        stat = path.stat()
+        assert fs.read_spec_file("written-feature", "tasks.md") == "# Tasks A"
+
+        fs.write_spec_file("written-feature", "tasks.md", "# Tasks B")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert fs.read_spec_file("written-feature", "tasks.md") == "# Tasks B"
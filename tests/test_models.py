@@ -1,11 +1,12 @@
 """Unit tests for data models."""
 
+import json
 from datetime import datetime
 from pathlib import Path
 
 import pytest
-from pydantic import ValidationError
 
+from cc_sdd_mcp.models.clock import frozen_now
 from cc_sdd_mcp.models.specification import (
     SpecificationMetadata,
     SpecPhase,
@@ -17,6 +18,7 @@ from cc_sdd_mcp.models.steering import (
     SteeringFileType,
 )
 from cc_sdd_mcp.models.validation import (
+    DesignValidationResult,
     ValidationIssue,
     ValidationResult,
     ValidationSeverity,
@@ -39,7 +41,7 @@ class TestSteeringModels:
 
     def test_steering_document_empty_content_fails(self):
         """Test that empty content fails validation."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             SteeringDocument(
                 file_type=SteeringFileType.PRODUCT,
                 file_path=Path(".kiro/steering/product.md"),
@@ -56,7 +58,7 @@ class TestSteeringModels:
 
     def test_steering_config_invalid_language(self):
         """Test that invalid language fails validation."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             SteeringConfig(language="invalid")
 
 
@@ -81,6 +83,30 @@ class TestSpecificationModels:
         )
         assert metadata.feature_name == "user-authentication"
 
+    def test_feature_name_normalization_non_ascii(self):
+        """Test that non-ASCII feature names are lowercased too."""
+        metadata = SpecificationMetadata(
+            feature_name="  Ürün Kataloğu ",
+            description="Test",
+        )
+        assert metadata.feature_name == "ürün-kataloğu"
+
+    def test_specification_metadata_json_bytes(self):
+        """Test that metadata bytes round-trip as UTF-8 JSON."""
+        metadata = SpecificationMetadata(feature_name="Ürün", description="Test")
+        data = metadata.to_json_bytes()
+        assert data == metadata.model_dump_json(indent=2).encode()
+        assert SpecificationMetadata.model_validate_json(data) == metadata
+
+    def test_frozen_now_shares_timestamp(self):
+        """Test that models built under frozen_now() share one timestamp."""
+        with frozen_now() as now:
+            metadata = SpecificationMetadata(feature_name="test", description="Test")
+        assert metadata.created_at == metadata.updated_at == now
+
+        later = SpecificationMetadata(feature_name="test", description="Test")
+        assert later.created_at >= now
+
     def test_task_item_creation(self):
         """Test creating a TaskItem."""
         task = TaskItem(
@@ -93,6 +119,13 @@ class TestSpecificationModels:
         assert task.completed is False
         assert task.estimated_hours == 2.0
 
+    def test_task_item_dict_roundtrip(self):
+        """Test TaskItem conversion to and from dictionaries."""
+        task = TaskItem(task_id="2.1", title="Write tests", description="Cover OAuth flow")
+        data = task.to_dict()
+        assert data["dependencies"] == []
+        assert TaskItem.from_dict(data) == task
+
 
 class TestValidationModels:
     """Tests for validation data models."""
@@ -133,3 +166,36 @@ class TestValidationModels:
         assert result.error_count == 1
         assert result.warning_count == 1
         assert result.info_count == 1
+
+    def test_validation_result_counts_follow_issues(self):
+        """Test that counts include issues appended after construction."""
+        result = ValidationResult(
+            validation_type="design",
+            feature_name="test-feature",
+            passed=True,
+            summary="Test validation",
+        )
+        result.issues.append(ValidationIssue(severity=ValidationSeverity.ERROR, message="Error 1"))
+        result.issues.append(
+            ValidationIssue(severity=ValidationSeverity.CRITICAL, message="Critical 1")
+        )
+        assert result.error_count == 2
+        assert result.warning_count == 0
+
+    def test_validation_result_to_dict(self):
+        """Test that result dictionaries contain only JSON primitives."""
+        result = DesignValidationResult(
+            validation_type="design",
+            feature_name="test-feature",
+            passed=True,
+            issues=[ValidationIssue(severity=ValidationSeverity.WARNING, message="Warning 1")],
+            summary="Test validation",
+            requirements_coverage=80.0,
+            design_completeness=60.0,
+        )
+        data = json.loads(json.dumps(result.to_dict()))
+
+        assert data["issues"][0]["severity"] == "warning"
+        assert "location" not in data["issues"][0]
+        assert data["requirements_coverage"] == 80.0
+        assert data["validated_at"] == result.validated_at.isoformat()
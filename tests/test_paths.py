@@ -0,0 +1,52 @@
+"""Tests for path utilities."""
+
+import pytest
+
+from cc_sdd_mcp.utils.paths import (
+    clear_project_root_cache,
+    ensure_directory_exists,
+    find_project_root,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_project_root_cache():
+    """Start and finish each test with an empty project root cache."""
+    clear_project_root_cache()
+    yield
+    clear_project_root_cache()
+
+
+class TestFindProjectRoot:
+    """Test project root discovery."""
+
+    def test_finds_nearest_indicator(self, tmp_path):
+        """Test that the closest ancestor with an indicator wins."""
+        (tmp_path / "pyproject.toml").write_text("")
+        inner = tmp_path / "inner"
+        inner.mkdir()
+
+        assert find_project_root(inner) == tmp_path
+
+    def test_result_is_cached_until_cleared(self, tmp_path):
+        """Test that a new indicator is only seen after the cache is cleared."""
+        (tmp_path / "pyproject.toml").write_text("")
+        inner = tmp_path / "inner"
+        inner.mkdir()
+        assert find_project_root(inner) == tmp_path
+
+        (inner / ".git").mkdir()
+        assert find_project_root(inner) == tmp_path
+
+        clear_project_root_cache()
+        assert find_project_root(inner) == inner
+
+    def test_creating_kiro_dir_clears_cache(self, tmp_path):
+        """Test that ensure_directory_exists makes a new .kiro visible."""
+        (tmp_path / "pyproject.toml").write_text("")
+        inner = tmp_path / "inner"
+        inner.mkdir()
+        assert find_project_root(inner) == tmp_path
+
+        ensure_directory_exists(inner / ".kiro" / "steering")
+        assert find_project_root(inner) == inner
@@ -2,7 +2,11 @@
 
 import pytest
 
-from cc_sdd_mcp.utils.templates import TemplateLoader
+from cc_sdd_mcp.utils.templates import (
+    TemplateLoader,
+    clear_template_cache,
+    get_template_loader,
+)
 
 
 class TestTemplateLoader:
@@ -15,6 +19,13 @@ class TestTemplateLoader:
         assert loader.project_dir == tmp_path
         assert loader.jinja_env is not None
 
+    def test_get_template_loader_is_cached(self, tmp_path):
+        """Test loaders are shared per project directory and language."""
+        loader = get_template_loader(tmp_path, "ja")
+        assert loader.language == "ja"
+        assert get_template_loader(tmp_path / ".", "ja") is loader
+        assert get_template_loader(tmp_path, "en") is not loader
+
     def test_render_jinja_template(self, tmp_path):
         """Test rendering a Jinja2 template from string."""
         loader = TemplateLoader(project_dir=tmp_path)
@@ -105,6 +116,23 @@ class TestTemplateLoader:
         assert loader._extract_language("product.ja.md") == "ja"
         assert loader._extract_language("product.md") == "default"
 
+    def test_get_template_path_fallback_is_cached(self, tmp_path):
+        """Test language fallback and that resolved paths are memoized."""
+        loader = TemplateLoader(project_dir=tmp_path, language="ja")
+        loader.templates_dir = tmp_path
+        (tmp_path / "specs").mkdir()
+        en_path = tmp_path / "specs" / "design.en.md"
+        en_path.write_text("# Design")
+
+        assert loader._get_template_path("specs", "design") == en_path
+
+        ja_path = tmp_path / "specs" / "design.ja.md"
+        ja_path.write_text("# 設計")
+        assert loader._get_template_path("specs", "design") == en_path
+
+        clear_template_cache()
+        assert loader._get_template_path("specs", "design") == ja_path
+
     def test_substitute_variables_backward_compat(self, tmp_path):
         """Test that old string substitution still works."""
         loader = TemplateLoader(project_dir=tmp_path)